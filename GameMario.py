@@ -19,8 +19,9 @@ from __future__ import annotations
 import math
 import random
 import sys
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import List, Sequence, Tuple, Optional
+from typing import Iterator, List, Sequence, Tuple, Optional
 
 import pygame
 
@@ -33,6 +34,8 @@ pygame.init()
 SCREEN_WIDTH = 960
 SCREEN_HEIGHT = 600
 FPS = 60
+IDLE_FPS = 30
+JUMP_KEYS = (pygame.K_SPACE, pygame.K_UP, pygame.K_w)
 
 AVAILABLE_RESOLUTIONS: List[Tuple[int, int]] = [
     (960, 600),
@@ -111,6 +114,41 @@ EMBER = pygame.Color(255, 120, 90)
 MINT = pygame.Color(140, 255, 214)
 SLATE = pygame.Color(70, 90, 130)
 SMOKE = pygame.Color(200, 235, 255)
+PROJECTILE_TAIL = pygame.Color(255, 200, 160)
+BOSS_TARGETED_COLOUR = pygame.Color(200, 160, 255)
+SUIT_LEG = pygame.Color(60, 80, 150)
+SHIELD_SPARK = pygame.Color(140, 230, 255)
+SHIELD_SHARD = pygame.Color(120, 200, 255)
+BOUNCE_STRIPE = pygame.Color(255, 255, 255, 80)
+RIFT_EDGE_GLOW = pygame.Color(RIFT_GLOW.r, RIFT_GLOW.g, RIFT_GLOW.b, 90)
+RIFT_INNER_FILL = pygame.Color(80, 255, 230, 140)
+RIFT_INNER_EDGE = pygame.Color(255, 255, 255, 110)
+RIFT_RIBBON = pygame.Color(120, 255, 250, 120)
+ARENA_GRID_COLUMN = pygame.Color(255, 255, 255, 26)
+ARENA_GRID_ROW = pygame.Color(255, 255, 255, 18)
+ARENA_BORDER = pygame.Color(210, 240, 255, 90)
+PILLAR_SHINE = pygame.Color(255, 255, 255, 110)
+PILLAR_SHADOW = pygame.Color(0, 0, 0, 120)
+BRUTE_FULL = pygame.Color(180, 110, 200)
+BRUTE_HURT = pygame.Color(210, 150, 240)
+HEALTH_BAR_BACK = pygame.Color(40, 10, 60)
+HEALTH_BAR_FILL = pygame.Color(200, 140, 255)
+TURRET_LENS = pygame.Color(255, 255, 255, 190)
+PLAYER_SHADOW = pygame.Color(0, 0, 0, 110)
+VISOR_FRAME = pygame.Color(40, 50, 120)
+JET_GLOW = pygame.Color(255, 255, 255, 160)
+JET_EXHAUST = pygame.Color(120, 200, 255, 160)
+SUIT_ARM = pygame.Color(180, 170, 255)
+BOSS_PUPIL = pygame.Color(40, 10, 80)
+BOSS_PIP = pygame.Color(255, 210, 120)
+COIN_GOLD = pygame.Color(255, 240, 100)
+COIN_SHINE = pygame.Color(255, 255, 255, 190)
+PORTAL_TAIL = pygame.Color(150, 255, 255, 140)
+MOON_SHINE = pygame.Color(255, 255, 255, 220)
+RIFT_SPOKE = pygame.Color(80, 220, 255, 70)
+RIFT_BEAM = pygame.Color(180, 255, 255, 80)
+HEART_EMPTY = pygame.Color(70, 70, 70)
+HEART_EMPTY_OUTLINE = pygame.Color(120, 120, 120)
 
 GRAVITY = 0.65
 PLAYER_SPEED = 6
@@ -136,6 +174,15 @@ HIT_INVINC_DURATION = 2.5
 FALL_RESPAWN_INVULN = 1.4
 COMBO_NOVA_RADIUS = 400
 STOMP_PROTECT_DURATION = 0.25
+CULL_MARGIN = 200
+SLASH_GRID_PAD = 32
+PICKUP_REACH = 6
+MOON_RADIUS = 38
+
+# Cosmetic randomness, kept off the gameplay ``random`` stream.
+_FX_RNG = random.Random()
+fx_uniform = _FX_RNG.uniform
+_floor = math.floor
 
 FONT = pygame.font.Font(None, 36)
 TITLE_FONT = pygame.font.Font(None, 96)
@@ -153,18 +200,117 @@ def clamp(value: float, minimum: float, maximum: float) -> float:
     return max(minimum, min(value, maximum))
 
 
+TEXT_CACHE_LIMIT = 256
+_TEXT_SURFACES: dict[tuple, pygame.Surface] = {}
+
+
 def draw_text(surface: pygame.Surface, text: str, pos: Tuple[int, int], *,
               colour: pygame.Color = WHITE, font: pygame.font.Font = FONT,
               anchor: str = "topleft") -> pygame.Rect:
-    rendered = font.render(text, True, colour)
+    key = (id(font), text, tuple(colour))
+    rendered = _TEXT_SURFACES.get(key)
+    if rendered is None:
+        if len(_TEXT_SURFACES) >= TEXT_CACHE_LIMIT:
+            _TEXT_SURFACES.clear()
+        rendered = _TEXT_SURFACES[key] = font.render(text, True, colour)
     rect = rendered.get_rect()
     setattr(rect, anchor, pos)
     surface.blit(rendered, rect)
     return rect
 
 
+class DrawBatch:
+    # pygame-ce exposes ``fblits``, classic pygame ``blits``.
+    _use_fblits = hasattr(pygame.Surface, "fblits")
+
+    def __init__(self) -> None:
+        self.items: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+
+    def add(self, sprite: pygame.Surface, pos: Tuple[int, int]) -> None:
+        self.items.append((sprite, pos))
+
+    def extend(self, sprites: Sequence[Tuple[pygame.Surface, Tuple[int, int]]]) -> None:
+        self.items.extend(sprites)
+
+    def flush(self, target: pygame.Surface) -> None:
+        if not self.items:
+            return
+        if self._use_fblits:
+            target.fblits(self.items)
+        else:
+            target.blits(self.items, doreturn=False)
+        self.items.clear()
+
+
+def finish_stamp(stamp: pygame.Surface) -> pygame.Surface:
+    if pygame.display.get_surface() is not None:
+        return stamp.convert_alpha()
+    return stamp
+
+
+_SCREEN_VEILS: dict[tuple, pygame.Surface] = {}
+
+
+def screen_veil(size: Tuple[int, int], colour: Tuple[int, int, int, int]) -> pygame.Surface:
+    key = (size, colour)
+    veil = _SCREEN_VEILS.get(key)
+    if veil is None:
+        veil = pygame.Surface(size, pygame.SRCALPHA)
+        veil.fill(colour)
+        veil = _SCREEN_VEILS[key] = finish_stamp(veil)
+    return veil
+
+
+_SCRATCH_LAYERS: dict[Tuple[int, int], pygame.Surface] = {}
+_RIFT_SPOKES: dict[Tuple[int, int], pygame.Surface] = {}
+
+
+def scratch_layer(size: Tuple[int, int]) -> pygame.Surface:
+    layer = _SCRATCH_LAYERS.get(size)
+    if layer is None:
+        layer = _SCRATCH_LAYERS[size] = pygame.Surface(size, pygame.SRCALPHA)
+    else:
+        layer.fill((0, 0, 0, 0))
+    return layer
+
+
+_HEART_STAMPS: dict[tuple, pygame.Surface] = {}
+
+
 def draw_heart(surface: pygame.Surface, centre: Tuple[int, int], size: int,
                colour: pygame.Color, outline: pygame.Color | None = None) -> None:
+    key = (size, tuple(colour), tuple(outline) if outline else None)
+    stamp = _HEART_STAMPS.get(key)
+    if stamp is None:
+        stamp = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        _render_heart(stamp, (size, size), size, colour, outline)
+        stamp = finish_stamp(stamp)
+        _HEART_STAMPS[key] = stamp
+    surface.blit(stamp, (centre[0] - size, centre[1] - size))
+
+
+HUD_HEART_SIZE = 28
+HUD_HEART_SPACING = 38
+_HEART_ROWS: dict[Tuple[int, int], pygame.Surface] = {}
+
+
+def heart_row(count: int, filled: int) -> pygame.Surface:
+    key = (count, filled)
+    row = _HEART_ROWS.get(key)
+    if row is not None:
+        return row
+    size = HUD_HEART_SIZE
+    row = pygame.Surface((max(1, (count - 1) * HUD_HEART_SPACING + size * 2), size * 2), pygame.SRCALPHA)
+    for i in range(count):
+        full = i < filled
+        draw_heart(row, (size + i * HUD_HEART_SPACING, size), size,
+                   CRIMSON if full else HEART_EMPTY, WHITE if full else HEART_EMPTY_OUTLINE)
+    row = _HEART_ROWS[key] = finish_stamp(row)
+    return row
+
+
+def _render_heart(surface: pygame.Surface, centre: Tuple[int, int], size: int,
+                  colour: pygame.Color, outline: pygame.Color | None = None) -> None:
     half = size // 2
     top_offset = int(size * 0.2)
     left_circle = (centre[0] - half // 2, centre[1] - top_offset)
@@ -183,35 +329,306 @@ def draw_heart(surface: pygame.Surface, centre: Tuple[int, int], size: int,
         pygame.draw.circle(surface, outline, right_circle, radius, 2)
         pygame.draw.polygon(surface, outline, points, 2)
 
+
+_GLOW_DISCS: dict[tuple, pygame.Surface] = {}
+
+
+def glow_disc(size: Tuple[int, int], centre: Tuple[int, int], radius: int,
+              colour: Tuple[int, int, int, int]) -> pygame.Surface:
+    key = (size, centre, radius, colour)
+    disc = _GLOW_DISCS.get(key)
+    if disc is None:
+        disc = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(disc, colour, centre, radius)
+        disc = finish_stamp(disc)
+        _GLOW_DISCS[key] = disc
+    return disc
+
+
+class SpatialGrid:
+    def __init__(self, cell: int = 64) -> None:
+        self.cell = cell
+        self.buckets: dict[Tuple[int, int], list] = {}
+
+    def clear(self) -> None:
+        self.buckets.clear()
+
+    def add(self, x: float, y: float, item: object) -> None:
+        key = (int(x) // self.cell, int(y) // self.cell)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            self.buckets[key] = [item]
+        else:
+            bucket.append(item)
+
+    def nearby(self, x: float, y: float) -> Iterator:
+        cell_x = int(x) // self.cell
+        cell_y = int(y) // self.cell
+        buckets = self.buckets
+        for gx in (cell_x - 1, cell_x, cell_x + 1):
+            for gy in (cell_y - 1, cell_y, cell_y + 1):
+                bucket = buckets.get((gx, gy))
+                if bucket:
+                    yield from bucket
+
+    def region(self, area: pygame.Rect) -> Iterator:
+        # Items are keyed by their centre; pad ``area`` by the item half-extent.
+        cell = self.cell
+        buckets = self.buckets
+        for gx in range(area.left // cell, (area.right - 1) // cell + 1):
+            for gy in range(area.top // cell, (area.bottom - 1) // cell + 1):
+                bucket = buckets.get((gx, gy))
+                if bucket:
+                    yield from bucket
+
+    def discard(self, x: float, y: float, item: object) -> None:
+        bucket = self.buckets.get((int(x) // self.cell, int(y) // self.cell))
+        if bucket and item in bucket:
+            bucket.remove(item)
+
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Particle:
-    pos: pygame.Vector2
-    vel: pygame.Vector2
+    x: float
+    y: float
+    vx: float
+    vy: float
     life: float
     colour: pygame.Color
     radius: float
 
-    def update(self, dt: float) -> None:
-        self.life -= dt
-        self.pos += self.vel * dt
-        self.vel *= 0.92
-        self.radius = max(0.0, self.radius - 18 * dt)
 
-    def draw(self, surface: pygame.Surface, camera_x: float) -> None:
-        if self.life <= 0 or self.radius <= 0:
-            return
-        pygame.draw.circle(surface, self.colour,
-                           (int(self.pos.x - camera_x), int(self.pos.y)),
-                           int(self.radius))
+_PARTICLE_DOTS: dict[Tuple[Tuple[int, ...], int], pygame.Surface] = {}
+
+
+def particle_dot(colour: pygame.Color, radius: int) -> pygame.Surface:
+    # Centred at (radius + 1, radius + 1).
+    key = (tuple(colour), radius)
+    dot = _PARTICLE_DOTS.get(key)
+    if dot is None:
+        size = radius * 2 + 2
+        dot = pygame.Surface((size, size))
+        backdrop = (0, 0, 0) if tuple(colour)[:3] != (0, 0, 0) else (255, 0, 255)
+        dot.fill(backdrop)
+        pygame.draw.circle(dot, colour, (radius + 1, radius + 1), radius)
+        dot.set_colorkey(backdrop)
+        _PARTICLE_DOTS[key] = dot
+    return dot
+
+
+FREE_LIST_LIMIT = 512
+_FREE_PARTICLES: List[Particle] = []
+
+
+def acquire_particle(x: float, y: float, vx: float, vy: float, life: float,
+                     colour: pygame.Color, radius: float) -> Particle:
+    if _FREE_PARTICLES:
+        particle = _FREE_PARTICLES.pop()
+        particle.x = x
+        particle.y = y
+        particle.vx = vx
+        particle.vy = vy
+        particle.life = life
+        particle.colour = colour
+        particle.radius = radius
+        return particle
+    return Particle(x, y, vx, vy, life, colour, radius)
+
+
+BURST_TEMPLATE_COUNT = 32
+_BURST_TEMPLATES: dict[tuple, List[List[Tuple[float, float, float, float, float]]]] = {}
+
+
+def _burst_templates(count: int, speeds: Tuple[float, float], lives: Tuple[float, float],
+                     radii: Tuple[float, float],
+                     arc: Tuple[float, float]) -> List[List[Tuple[float, float, float, float, float]]]:
+    key = ("burst", count, speeds, lives, radii, arc)
+    bank = _BURST_TEMPLATES.get(key)
+    if bank is not None:
+        return bank
+    uniform, cos, sin = fx_uniform, math.cos, math.sin
+    arc_low, arc_high = arc
+    speed_low, speed_high = speeds
+    life_low, life_high = lives
+    radius_low, radius_high = radii
+    bank = []
+    for _ in range(BURST_TEMPLATE_COUNT):
+        template = []
+        for _ in range(count):
+            angle = uniform(arc_low, arc_high)
+            speed = uniform(speed_low, speed_high)
+            template.append((0.0, cos(angle) * speed, sin(angle) * speed,
+                             uniform(life_low, life_high), uniform(radius_low, radius_high)))
+        bank.append(template)
+    _BURST_TEMPLATES[key] = bank
+    return bank
+
+
+def _spray_templates(count: int, offsets: Tuple[float, float], vxs: Tuple[float, float],
+                     vys: Tuple[float, float], lives: Tuple[float, float],
+                     radii: Tuple[float, float]) -> List[List[Tuple[float, float, float, float, float]]]:
+    key = ("spray", count, offsets, vxs, vys, lives, radii)
+    bank = _BURST_TEMPLATES.get(key)
+    if bank is None:
+        uniform = fx_uniform
+        bank = _BURST_TEMPLATES[key] = [
+            [(uniform(*offsets), uniform(*vxs), uniform(*vys), uniform(*lives), uniform(*radii))
+             for _ in range(count)]
+            for _ in range(BURST_TEMPLATE_COUNT)
+        ]
+    return bank
+
+
+def _emit_template(x: float, y: float, template: List[Tuple[float, float, float, float, float]],
+                   colour: pygame.Color) -> List[Particle]:
+    acquire = acquire_particle
+    return [acquire(x + dx, y, vx, vy, life, colour, radius) for dx, vx, vy, life, radius in template]
+
+
+def emit_burst(x: float, y: float, count: int, speeds: Tuple[float, float], lives: Tuple[float, float],
+               radii: Tuple[float, float], colour: pygame.Color,
+               arc: Tuple[float, float] = (0.0, math.tau)) -> List[Particle]:
+    bank = _burst_templates(count, speeds, lives, radii, arc)
+    return _emit_template(x, y, bank[_FX_RNG.randrange(BURST_TEMPLATE_COUNT)], colour)
+
+
+def emit_spray(x: float, y: float, count: int, offsets: Tuple[float, float], vxs: Tuple[float, float],
+               vys: Tuple[float, float], lives: Tuple[float, float], radii: Tuple[float, float],
+               colour: pygame.Color) -> List[Particle]:
+    bank = _spray_templates(count, offsets, vxs, vys, lives, radii)
+    return _emit_template(x, y, bank[_FX_RNG.randrange(BURST_TEMPLATE_COUNT)], colour)
+
+
+def release_particles(particles: Sequence[Particle]) -> None:
+    room = FREE_LIST_LIMIT - len(_FREE_PARTICLES)
+    if room > 0:
+        _FREE_PARTICLES.extend(particles[:room])
+
+
+_PLATFORM_LAYERS: dict[tuple, pygame.Surface] = {}
+
+
+def _bounce_pad(size: Tuple[int, int]) -> pygame.Surface:
+    key = ("bounce", size)
+    pad = _PLATFORM_LAYERS.get(key)
+    if pad is not None:
+        return pad
+    width, height = size
+    pad = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(pad, BOUNCY_CORAL, pad.get_rect(), border_radius=8)
+    highlight = pad.get_rect().inflate(-12, -10)
+    highlight.top = 4
+    pygame.draw.rect(pad, BOUNCY_TOP, highlight, border_radius=6)
+    stripes = 4
+    stripe_height = max(2, height // (stripes * 2))
+    for i in range(stripes):
+        y = 6 + i * stripe_height * 2
+        pygame.draw.rect(pad, BOUNCE_STRIPE, pygame.Rect(6, y, width - 12, stripe_height), border_radius=4)
+    pad = _PLATFORM_LAYERS[key] = finish_stamp(pad)
+    return pad
+
+
+def _rift_gradient(size: Tuple[int, int], colour: Tuple[int, ...]) -> pygame.Surface:
+    key = ("rift", size, colour)
+    gradient = _PLATFORM_LAYERS.get(key)
+    if gradient is not None:
+        return gradient
+    height = size[1]
+    base_r, base_g, base_b = colour[:3]
+    column = pygame.Surface((1, height), pygame.SRCALPHA)
+    for y in range(height):
+        blend = y / max(1, height - 1)
+        r = int(clamp(lerp(base_r * 0.5 + 40, min(255, base_r + 90), blend), 0, 255))
+        g = int(clamp(lerp(base_g * 0.5 + 60, min(255, base_g + 50), blend), 0, 255))
+        b = int(clamp(lerp(base_b * 0.6 + 70, min(255, base_b + 30), blend), 0, 255))
+        column.set_at((0, y), (r, g, b, 255))
+    gradient = _PLATFORM_LAYERS[key] = finish_stamp(pygame.transform.scale(column, size))
+    return gradient
+
+
+def _rift_inner(size: Tuple[int, int]) -> pygame.Surface:
+    key = ("rift_inner", size)
+    inner = _PLATFORM_LAYERS.get(key)
+    if inner is not None:
+        return inner
+    inner = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(inner, RIFT_INNER_FILL, inner.get_rect(), border_radius=10)
+    pygame.draw.rect(inner, RIFT_INNER_EDGE, inner.get_rect(), 2, border_radius=10)
+    inner = _PLATFORM_LAYERS[key] = finish_stamp(inner)
+    return inner
+
+
+def _arena_tile(size: Tuple[int, int], colour: Tuple[int, ...]) -> pygame.Surface:
+    key = ("arena", size, colour)
+    tile = _PLATFORM_LAYERS.get(key)
+    if tile is not None:
+        return tile
+    width, height = size
+    tile = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(tile, colour, tile.get_rect(), border_radius=18)
+    grid = pygame.Surface(size, pygame.SRCALPHA)
+    step = max(44, min(72, width // 12))
+    for x in range(0, width, step):
+        pygame.draw.line(grid, ARENA_GRID_COLUMN, (x, 0), (x, height))
+    for y in range(0, height, step):
+        pygame.draw.line(grid, ARENA_GRID_ROW, (0, y), (width, y))
+    tile.blit(grid, (0, 0), special_flags=pygame.BLEND_ADD)
+    border = tile.get_rect().inflate(-max(12, width // 9), -max(12, height // 9))
+    pygame.draw.rect(tile, ARENA_BORDER, border, width=3, border_radius=16)
+    tile = _PLATFORM_LAYERS[key] = finish_stamp(tile)
+    return tile
+
+
+def _pillar_body(size: Tuple[int, int], colour: Tuple[int, ...]) -> pygame.Surface:
+    key = ("pillar", size, colour)
+    pillar = _PLATFORM_LAYERS.get(key)
+    if pillar is not None:
+        return pillar
+    height = size[1]
+    base_r, base_g, base_b = colour[:3]
+    pillar = pygame.Surface(size, pygame.SRCALPHA)
+    body_rect = pillar.get_rect()
+    pygame.draw.rect(pillar, colour, body_rect, border_radius=14)
+    column = pygame.Surface((1, height), pygame.SRCALPHA)
+    for y in range(height):
+        blend = y / max(1, height - 1)
+        column.set_at((0, y), (
+            clamp(int(base_r + (255 - base_r) * (1 - blend * 0.55)), 0, 255),
+            clamp(int(base_g + (245 - base_g) * (1 - blend * 0.55)), 0, 255),
+            clamp(int(base_b + (255 - base_b) * 0.4 * (1 - blend)), 0, 255),
+            clamp(int(190 - blend * 90), 70, 220),
+        ))
+    pillar.blit(pygame.transform.scale(column, size), (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    highlight = pygame.Rect(
+        body_rect.left + body_rect.width // 4,
+        body_rect.top + body_rect.height // 5,
+        body_rect.width // 2,
+        body_rect.height // 2,
+    )
+    pygame.draw.ellipse(pillar, PILLAR_SHINE, highlight)
+    pillar = _PLATFORM_LAYERS[key] = finish_stamp(pillar)
+    return pillar
+
+
+def _pillar_shadow(size: Tuple[int, int]) -> pygame.Surface:
+    key = ("pillar_shadow", size)
+    shadow = _PLATFORM_LAYERS.get(key)
+    if shadow is not None:
+        return shadow
+    shadow = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.ellipse(shadow, PILLAR_SHADOW, shadow.get_rect())
+    shadow = _PLATFORM_LAYERS[key] = finish_stamp(shadow)
+    return shadow
 
 
-@dataclass
+@dataclass(slots=True)
 class Platform:
+    is_moving = False
+
     rect: pygame.Rect
     colour: pygame.Color = field(default_factory=lambda: pygame.Color(BRICK))
     is_bouncy: bool = False
@@ -219,200 +636,140 @@ class Platform:
     style: str = "standard"
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
-        offset = self.rect.move(-camera_x, 0)
+        x, top, width, height = self.rect
+        left = x - int(camera_x)
         if self.style == "rift":
-            self._draw_rift(surface, offset)
+            self._draw_rift(surface, left, top)
             return
         if self.style == "arena":
-            self._draw_arena(surface, offset)
+            self._draw_arena(surface, left, top)
             return
         if self.style == "pillar":
-            self._draw_pillar(surface, offset)
+            self._draw_pillar(surface, left, top)
             return
-        pygame.draw.rect(surface, self.colour, offset, border_radius=4)
+        pygame.draw.rect(surface, self.colour, (left, top, width, height), border_radius=4)
         if self.is_bouncy:
-            pad = offset.inflate(-6, -4)
-            pad.height = max(12, pad.height - 6)
-            pad.top = offset.top + 3
-            bounce_surface = pygame.Surface(pad.size, pygame.SRCALPHA)
-            pygame.draw.rect(bounce_surface, BOUNCY_CORAL, bounce_surface.get_rect(), border_radius=8)
-            highlight = bounce_surface.get_rect().inflate(-12, -10)
-            highlight.top = 4
-            pygame.draw.rect(bounce_surface, BOUNCY_TOP, highlight, border_radius=6)
-            stripes = 4
-            stripe_height = max(2, pad.height // (stripes * 2))
-            for i in range(stripes):
-                y = 6 + i * stripe_height * 2
-                pygame.draw.rect(
-                    bounce_surface,
-                    pygame.Color(255, 255, 255, 80),
-                    pygame.Rect(6, y, pad.width - 12, stripe_height),
-                    border_radius=4,
-                )
-            surface.blit(bounce_surface, pad.topleft)
+            surface.blit(_bounce_pad((width - 6, max(12, height - 10))), (left + 3, top + 3))
         else:
-            grass_top = pygame.Rect(offset.x, offset.y, offset.width, 12)
-            pygame.draw.rect(surface, GRASS, grass_top, border_radius=6)
+            pygame.draw.rect(surface, GRASS, (left, top, width, 12), border_radius=6)
 
-    def _draw_rift(self, surface: pygame.Surface, offset: pygame.Rect) -> None:
-        top_rect = pygame.Rect(offset.x, offset.y, offset.width, offset.height)
-        if top_rect.width <= 0 or top_rect.height <= 0:
+    def _draw_rift(self, surface: pygame.Surface, left: int, top: int) -> None:
+        size = width, height = self.rect.size
+        if width <= 0 or height <= 0:
             return
-        gradient = pygame.Surface((top_rect.width, top_rect.height), pygame.SRCALPHA)
-        base_colour = pygame.Color(self.colour)
-        for y in range(top_rect.height):
-            blend = y / max(1, top_rect.height - 1)
-            r = int(clamp(lerp(base_colour.r * 0.5 + 40, min(255, base_colour.r + 90), blend), 0, 255))
-            g = int(clamp(lerp(base_colour.g * 0.5 + 60, min(255, base_colour.g + 50), blend), 0, 255))
-            b = int(clamp(lerp(base_colour.b * 0.6 + 70, min(255, base_colour.b + 30), blend), 0, 255))
-            pygame.draw.line(gradient, (r, g, b, 255), (0, y), (top_rect.width, y))
-        surface.blit(gradient, top_rect.topleft)
-        pygame.draw.rect(surface, RIFT_GLOW, top_rect, width=2, border_radius=12)
-
-        depth = max(28, int(top_rect.height * 1.5))
-        skew = max(24, top_rect.width // 5)
+        right = left + width
+        bottom = top + height
+        surface.blit(_rift_gradient(size, tuple(self.colour)), (left, top))
+        pygame.draw.rect(surface, RIFT_GLOW, (left, top, width, height), width=2, border_radius=12)
+
+        depth = max(28, int(height * 1.5))
+        skew = max(24, width // 5)
         front_points = [
-            (top_rect.left, top_rect.bottom),
-            (top_rect.right, top_rect.bottom),
-            (top_rect.right + skew, top_rect.bottom + depth),
-            (top_rect.left - skew, top_rect.bottom + depth),
+            (left, bottom),
+            (right, bottom),
+            (right + skew, bottom + depth),
+            (left - skew, bottom + depth),
         ]
         pygame.draw.polygon(surface, RIFT_DEEP, front_points)
         glow_points = [
-            (top_rect.left, top_rect.bottom),
-            (top_rect.left - skew // 2, top_rect.bottom + depth // 2),
-            (top_rect.right + skew // 2, top_rect.bottom + depth // 2),
-            (top_rect.right, top_rect.bottom),
+            (left, bottom),
+            (left - skew // 2, bottom + depth // 2),
+            (right + skew // 2, bottom + depth // 2),
+            (right, bottom),
         ]
-        pygame.draw.polygon(surface, pygame.Color(RIFT_GLOW.r, RIFT_GLOW.g, RIFT_GLOW.b, 90), glow_points)
+        pygame.draw.polygon(surface, RIFT_EDGE_GLOW, glow_points)
 
-        inner = pygame.Rect(
-            top_rect.left + 14,
-            top_rect.top + 10,
-            max(12, top_rect.width - 28),
-            max(6, top_rect.height - 20),
-        )
-        inner_surface = pygame.Surface(inner.size, pygame.SRCALPHA)
-        pygame.draw.rect(inner_surface, pygame.Color(80, 255, 230, 140), inner_surface.get_rect(), border_radius=10)
-        pygame.draw.rect(inner_surface, pygame.Color(255, 255, 255, 110), inner_surface.get_rect(), 2, border_radius=10)
-        surface.blit(inner_surface, inner.topleft)
+        inner_size = (max(12, width - 28), max(6, height - 20))
+        surface.blit(_rift_inner(inner_size), (left + 14, top + 10))
 
-        rib_count = max(2, top_rect.width // 80)
+        rib_count = max(2, width // 80)
+        ribbon_top = top + 6
+        ribbon_bottom = bottom + depth - 12
         for idx in range(1, rib_count + 1):
             t = idx / (rib_count + 1)
-            rib_x = int(lerp(top_rect.left + 18, top_rect.right - 18, t))
-            ribbon_top = top_rect.top + 6
-            ribbon_bottom = top_rect.bottom + depth - 12
+            rib_x = int(lerp(left + 18, right - 18, t))
             pygame.draw.line(
                 surface,
-                pygame.Color(120, 255, 250, 120),
+                RIFT_RIBBON,
                 (rib_x, ribbon_top),
                 (rib_x + skew // 4, ribbon_bottom),
                 2,
             )
 
-    def _draw_arena(self, surface: pygame.Surface, offset: pygame.Rect) -> None:
-        if offset.width <= 0 or offset.height <= 0:
+    def _draw_arena(self, surface: pygame.Surface, left: int, top: int) -> None:
+        size = width, height = self.rect.size
+        if width <= 0 or height <= 0:
             return
-        tile = pygame.Surface(offset.size, pygame.SRCALPHA)
-        pygame.draw.rect(tile, self.colour, tile.get_rect(), border_radius=18)
-        grid = pygame.Surface(offset.size, pygame.SRCALPHA)
-        step = max(44, min(72, offset.width // 12))
-        grid_colour = pygame.Color(255, 255, 255, 26)
-        for x in range(0, offset.width, step):
-            pygame.draw.line(grid, grid_colour, (x, 0), (x, offset.height))
-        for y in range(0, offset.height, step):
-            pygame.draw.line(grid, pygame.Color(255, 255, 255, 18), (0, y), (offset.width, y))
-        tile.blit(grid, (0, 0), special_flags=pygame.BLEND_ADD)
-        border = tile.get_rect().inflate(-max(12, offset.width // 9), -max(12, offset.height // 9))
-        pygame.draw.rect(tile, pygame.Color(210, 240, 255, 90), border, width=3, border_radius=16)
-        surface.blit(tile, offset.topleft)
-
-    def _draw_pillar(self, surface: pygame.Surface, offset: pygame.Rect) -> None:
-        if offset.width <= 0 or offset.height <= 0:
+        surface.blit(_arena_tile(size, tuple(self.colour)), (left, top))
+
+    def _draw_pillar(self, surface: pygame.Surface, left: int, top: int) -> None:
+        size = width, height = self.rect.size
+        if width <= 0 or height <= 0:
             return
-        pillar = pygame.Surface(offset.size, pygame.SRCALPHA)
-        body_rect = pillar.get_rect()
-        base_colour = pygame.Color(self.colour)
-        pygame.draw.rect(pillar, base_colour, body_rect, border_radius=14)
-        gradient = pygame.Surface(offset.size, pygame.SRCALPHA)
-        for y in range(offset.height):
-            blend = y / max(1, offset.height - 1)
-            colour = pygame.Color(
-                clamp(int(base_colour.r + (255 - base_colour.r) * (1 - blend * 0.55)), 0, 255),
-                clamp(int(base_colour.g + (245 - base_colour.g) * (1 - blend * 0.55)), 0, 255),
-                clamp(int(base_colour.b + (255 - base_colour.b) * 0.4 * (1 - blend)), 0, 255),
-                clamp(int(190 - blend * 90), 70, 220),
-            )
-            pygame.draw.line(gradient, colour, (0, y), (offset.width, y))
-        pillar.blit(gradient, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-        highlight = pygame.Rect(
-            body_rect.left + body_rect.width // 4,
-            body_rect.top + body_rect.height // 5,
-            body_rect.width // 2,
-            body_rect.height // 2,
-        )
-        pygame.draw.ellipse(pillar, pygame.Color(255, 255, 255, 110), highlight)
-        surface.blit(pillar, offset.topleft)
-        shadow_surface = pygame.Surface((offset.width + 30, max(18, offset.height // 3)), pygame.SRCALPHA)
-        pygame.draw.ellipse(shadow_surface, pygame.Color(0, 0, 0, 120), shadow_surface.get_rect())
-        shadow_rect = shadow_surface.get_rect(center=(offset.centerx, offset.bottom + shadow_surface.get_height() // 2))
-        surface.blit(shadow_surface, shadow_rect)
+        surface.blit(_pillar_body(size, tuple(self.colour)), (left, top))
+        shadow_size = (width + 30, max(18, height // 3))
+        surface.blit(_pillar_shadow(shadow_size), (left + width // 2 - shadow_size[0] // 2, top + height))
 
 
-@dataclass
+@dataclass(slots=True)
 class MovingPlatform(Platform):
+    is_moving = True
+
     bounds_x: Tuple[int, int] = field(default_factory=lambda: (0, 0))
     bounds_y: Tuple[int, int] = field(default_factory=lambda: (0, 0))
     speed_x: float = 0.0
     speed_y: float = 0.0
     direction_x: int = 1
     direction_y: int = 1
-    _float_pos: pygame.Vector2 = field(default_factory=lambda: pygame.Vector2(0, 0))
-    last_move: pygame.Vector2 = field(default_factory=lambda: pygame.Vector2(0, 0), init=False)
+    _fx: float = field(default=0.0, init=False)
+    _fy: float = field(default=0.0, init=False)
+    last_move_x: float = field(default=0.0, init=False)
+    last_move_y: float = field(default=0.0, init=False)
+    base_plane_y: int = field(default=0, init=False)
+    three_d_depth: float = field(default=0.0, init=False)
 
     def __post_init__(self) -> None:
-        self._float_pos = pygame.Vector2(self.rect.topleft)
+        self._fx = float(self.rect.x)
+        self._fy = float(self.rect.y)
         self.base_plane_y = self.rect.y
         self.three_d_depth = 0.0
         if self.bounds_x == (0, 0):
             self.bounds_x = (self.rect.left, self.rect.left)
         if self.bounds_y == (0, 0):
             self.bounds_y = (self.rect.top, self.rect.top)
-        self.last_move = pygame.Vector2(0, 0)
+        self.last_move_x = 0.0
+        self.last_move_y = 0.0
 
     def update(self, dt: float, obstacles: Sequence[pygame.Rect] | None = None) -> None:
         obstacles = obstacles or ()
-        previous_pos = self._float_pos.copy()
-        proposed_x = self._float_pos.x
-        proposed_y = self._float_pos.y
+        rect = self.rect
+        width, height = rect.size
+        previous_x = self._fx
+        previous_y = self._fy
+        proposed_x = previous_x
+        proposed_y = previous_y
         if self.speed_x:
             proposed_x += self.speed_x * self.direction_x * dt * 60
-            if proposed_x < self.bounds_x[0]:
-                proposed_x = self.bounds_x[0]
+            low, high = self.bounds_x
+            if proposed_x < low:
+                proposed_x = low
                 self.direction_x *= -1
-            elif proposed_x + self.rect.width > self.bounds_x[1]:
-                proposed_x = self.bounds_x[1] - self.rect.width
+            elif proposed_x + width > high:
+                proposed_x = high - width
                 self.direction_x *= -1
         if self.speed_y:
             proposed_y += self.speed_y * self.direction_y * dt * 60
-            if proposed_y < self.bounds_y[0]:
-                proposed_y = self.bounds_y[0]
+            low, high = self.bounds_y
+            if proposed_y < low:
+                proposed_y = low
                 self.direction_y *= -1
-            elif proposed_y + self.rect.height > self.bounds_y[1]:
-                proposed_y = self.bounds_y[1] - self.rect.height
+            elif proposed_y + height > high:
+                proposed_y = high - height
                 self.direction_y *= -1
-        candidate_rect = pygame.Rect(
-            int(round(proposed_x)),
-            int(round(proposed_y)),
-            self.rect.width,
-            self.rect.height,
-        )
+        candidate_rect = pygame.Rect(round(proposed_x), round(proposed_y), width, height)
         collision_found = False
-        for obstacle in obstacles:
-            if obstacle is self.rect:
-                continue
-            if candidate_rect.colliderect(obstacle):
+        for index in candidate_rect.collidelistall(obstacles):
+            if obstacles[index] is not rect:
                 collision_found = True
                 break
         if collision_found:
@@ -420,12 +777,16 @@ class MovingPlatform(Platform):
                 self.direction_x *= -1
             if self.speed_y:
                 self.direction_y *= -1
-            self.last_move.xy = (0, 0)
-            self._float_pos = pygame.Vector2(self.rect.topleft)
+            self.last_move_x = 0.0
+            self.last_move_y = 0.0
+            self._fx = float(rect.x)
+            self._fy = float(rect.y)
             return
-        self._float_pos.xy = (proposed_x, proposed_y)
-        self.rect.topleft = candidate_rect.topleft
-        self.last_move.xy = (self._float_pos.x - previous_pos.x, self._float_pos.y - previous_pos.y)
+        self._fx = proposed_x
+        self._fy = proposed_y
+        rect.topleft = candidate_rect.topleft
+        self.last_move_x = proposed_x - previous_x
+        self.last_move_y = proposed_y - previous_y
 
 
 def clone_platform(source: Platform) -> Platform:
@@ -449,11 +810,27 @@ def clone_platform(source: Platform) -> Platform:
         return clone
     return Platform(**base_kwargs)
 
-@dataclass
+_EYE_STAMP: pygame.Surface | None = None
+
+
+def _enemy_eye_stamp() -> pygame.Surface:
+    global _EYE_STAMP
+    if _EYE_STAMP is None:
+        eye_radius = 4
+        eye_offset_x = 10
+        stamp = pygame.Surface((2 * (eye_offset_x + eye_radius + 1), 2 * (eye_radius + 1)), pygame.SRCALPHA)
+        centre_x, centre_y = stamp.get_width() // 2, stamp.get_height() // 2
+        pygame.draw.circle(stamp, WHITE, (centre_x - eye_offset_x, centre_y), eye_radius)
+        pygame.draw.circle(stamp, WHITE, (centre_x + eye_offset_x, centre_y), eye_radius)
+        _EYE_STAMP = finish_stamp(stamp)
+    return _EYE_STAMP
+
+
+@dataclass(slots=True)
 class Enemy:
     rect: pygame.Rect
     patrol: Tuple[int, int]
-    speed: float = 2.5
+    speed: int = 2
     direction: int = 1
     health: int = 1
     max_health: int = 1
@@ -466,11 +843,11 @@ class Enemy:
             self.death_timer -= dt
             return self.death_timer > 0
         if self.invulnerable > 0:
-            self.invulnerable = max(0.0, self.invulnerable - dt)
-        self.rect.x += int(self.speed * self.direction)
+            self.invulnerable = self.invulnerable - dt if self.invulnerable > dt else 0.0
+        self.rect.x += self.speed * self.direction
         if self.rect.left < self.patrol[0] or self.rect.right > self.patrol[1]:
             self.direction *= -1
-            self.rect.x += int(self.speed * self.direction)
+            self.rect.x += self.speed * self.direction
         return True
 
     def take_hit(self) -> str:
@@ -496,28 +873,21 @@ class Enemy:
         if self.max_health == 1:
             body_colour = CRIMSON
         else:
-            body_colour = pygame.Color(180, 110, 200) if self.health == self.max_health else pygame.Color(210, 150, 240)
+            body_colour = BRUTE_FULL if self.health == self.max_health else BRUTE_HURT
         pygame.draw.rect(surface, body_colour, offset, border_radius=8)
-        eye_radius = 4
-        eye_offset_y = 8
-        eye_offset_x = 10 * self.direction
-        pygame.draw.circle(surface, WHITE,
-                           (offset.centerx - eye_offset_x, offset.centery - eye_offset_y),
-                           eye_radius)
-        pygame.draw.circle(surface, WHITE,
-                           (offset.centerx + eye_offset_x, offset.centery - eye_offset_y),
-                           eye_radius)
+        eyes = _enemy_eye_stamp()
+        surface.blit(eyes, (offset.centerx - eyes.get_width() // 2, offset.centery - 8 - eyes.get_height() // 2))
         if self.max_health > 1 and self.health > 0:
             bar_height = 4
             bar_rect = pygame.Rect(offset.left + 4, offset.top + 4, offset.width - 8, bar_height)
-            pygame.draw.rect(surface, pygame.Color(40, 10, 60), bar_rect)
+            pygame.draw.rect(surface, HEALTH_BAR_BACK, bar_rect)
             fill_width = int(bar_rect.width * (self.health / self.max_health))
             if fill_width > 0:
                 fill_rect = pygame.Rect(bar_rect.left, bar_rect.top, fill_width, bar_rect.height)
-                pygame.draw.rect(surface, pygame.Color(200, 140, 255), fill_rect)
+                pygame.draw.rect(surface, HEALTH_BAR_FILL, fill_rect)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShooterEnemy:
     rect: pygame.Rect
     facing: int = 1
@@ -527,13 +897,15 @@ class ShooterEnemy:
     death_timer: float = 0.0
     pulse: float = field(default_factory=lambda: random.random() * math.tau)
 
-    def update(self, dt: float, target_x: float) -> tuple[bool, List["Projectile"]]:
+    def update(self, dt: float, target_x: float, on_screen: bool = True) -> tuple[bool, List["Projectile"]]:
         projectiles: List["Projectile"] = []
         if self.stomped:
             self.death_timer -= dt
             return self.death_timer > 0, projectiles
         self.pulse = (self.pulse + dt * 3.0) % math.tau
         self.facing = 1 if target_x >= self.rect.centerx else -1
+        if not on_screen:
+            return True, projectiles
         self.cooldown -= dt
         if self.cooldown <= 0:
             self.cooldown = self.fire_rate + random.uniform(-0.4, 0.6)
@@ -541,11 +913,10 @@ class ShooterEnemy:
         return True, projectiles
 
     def _fire_projectile(self) -> "Projectile":
-        start = pygame.Vector2(self.rect.centerx + self.facing * (self.rect.width // 2 + 10),
-                               self.rect.centery - 6)
+        start_x = self.rect.centerx + self.facing * (self.rect.width // 2 + 10)
         variance = random.uniform(-40, 40)
-        velocity = pygame.Vector2(PROJECTILE_SPEED * self.facing, variance)
-        return Projectile(pos=start, vel=velocity, radius=8, colour=EMBER)
+        return acquire_projectile(start_x, self.rect.centery - 6, PROJECTILE_SPEED * self.facing, variance,
+                                  radius=8, colour=EMBER)
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
         offset = self.rect.move(-camera_x, 0)
@@ -556,7 +927,7 @@ class ShooterEnemy:
             pygame.draw.rect(surface, CRIMSON, husk, border_radius=6)
             return
         glow = (math.sin(self.pulse) + 1) * 0.5
-        body_colour = pygame.Color(
+        body_colour = (
             int(200 + 40 * glow),
             int(70 + 50 * glow),
             int(140 + 60 * glow),
@@ -567,11 +938,112 @@ class ShooterEnemy:
         nozzle = pygame.Rect(0, 0, 18, 12)
         nozzle.center = (offset.centerx + self.facing * (offset.width // 2 + 6), offset.centery - 4)
         pygame.draw.rect(surface, SLATE, nozzle, border_radius=6)
-        lens_colour = pygame.Color(255, 255, 255, 190)
-        pygame.draw.circle(surface, lens_colour, (nozzle.centerx + self.facing * 4, nozzle.centery), 6)
+        pygame.draw.circle(surface, TURRET_LENS, (nozzle.centerx + self.facing * 4, nozzle.centery), 6)
 
 
-@dataclass
+_TORSO_CACHE: dict[Tuple[int, int, bool], pygame.Surface] = {}
+_VISOR_GLOW: pygame.Surface | None = None
+
+
+def _player_torso(size: Tuple[int, int], flicker: bool) -> pygame.Surface:
+    key = (size[0], size[1], flicker)
+    torso_surface = _TORSO_CACHE.get(key)
+    if torso_surface is None:
+        torso_surface = pygame.Surface(size, pygame.SRCALPHA)
+        torso_rect = torso_surface.get_rect()
+        pygame.draw.rect(torso_surface, pygame.Color(90, 150, 255), torso_rect, border_radius=16)
+        chestplate = pygame.Rect(6, 10, torso_rect.width - 12, torso_rect.height - 18)
+        pygame.draw.rect(torso_surface, pygame.Color(140, 200, 255), chestplate, border_radius=12)
+        glow_colour = pygame.Color(40, 70, 200, 180)
+        pygame.draw.rect(torso_surface, glow_colour, chestplate.inflate(-16, -16), border_radius=10)
+        if flicker:
+            torso_surface.fill((255, 255, 255, 90), special_flags=pygame.BLEND_RGBA_ADD)
+        torso_surface = finish_stamp(torso_surface)
+        _TORSO_CACHE[key] = torso_surface
+    return torso_surface
+
+
+def _player_visor_glow() -> pygame.Surface:
+    global _VISOR_GLOW
+    if _VISOR_GLOW is None:
+        visor_glow = pygame.Surface((48, 18), pygame.SRCALPHA)
+        pygame.draw.rect(visor_glow, pygame.Color(100, 200, 255, 160), visor_glow.get_rect(), border_radius=10)
+        _VISOR_GLOW = finish_stamp(visor_glow)
+    return _VISOR_GLOW
+
+
+_VISOR_STAMPS: dict[int, pygame.Surface] = {}
+_LEG_STAMPS: dict[Tuple[int, int], pygame.Surface] = {}
+_ARM_STAMP: pygame.Surface | None = None
+_PLAYER_SHADOWS: dict[int, pygame.Surface] = {}
+LEG_STAMP_PAD = 24
+
+
+def _player_visor(gaze: int) -> pygame.Surface:
+    visor = _VISOR_STAMPS.get(gaze)
+    if visor is None:
+        visor = pygame.Surface((48, 18), pygame.SRCALPHA)
+        pygame.draw.rect(visor, VISOR_FRAME, visor.get_rect(), border_radius=10)
+        visor.blit(_player_visor_glow(), (0, 0))
+        pygame.draw.circle(visor, MIDNIGHT, (24 - 12 + gaze, 9), 4)
+        pygame.draw.circle(visor, MIDNIGHT, (24 + 12 + gaze, 9), 4)
+        visor = _VISOR_STAMPS[gaze] = finish_stamp(visor)
+    return visor
+
+
+def _player_legs(width: int, stride: int) -> pygame.Surface:
+    # Anchored LEG_STAMP_PAD left of the suit and 8px above its bottom.
+    key = (width, stride)
+    legs = _LEG_STAMPS.get(key)
+    if legs is None:
+        pad = LEG_STAMP_PAD
+        legs = pygame.Surface((width + pad * 2, 24))
+        legs.fill((0, 0, 0))
+        jet_rect = pygame.Rect(pad + 10, 0, width - 20, 6)
+        pygame.draw.rect(legs, JET_GLOW, jet_rect, border_radius=3)
+        pygame.draw.rect(legs, JET_EXHAUST, (jet_rect.left, jet_rect.bottom, jet_rect.width, 10), border_radius=3)
+        centre_x = pad + width // 2
+        pygame.draw.circle(legs, SUIT_LEG, (centre_x - stride, 12), 7)
+        pygame.draw.circle(legs, SUIT_LEG, (centre_x + stride, 12), 7)
+        legs.set_colorkey((0, 0, 0))
+        _LEG_STAMPS[key] = legs
+    return legs
+
+
+def _player_arm() -> pygame.Surface:
+    global _ARM_STAMP
+    if _ARM_STAMP is None:
+        arm = pygame.Surface((18, 24), pygame.SRCALPHA)
+        pygame.draw.ellipse(arm, SUIT_ARM, arm.get_rect())
+        _ARM_STAMP = finish_stamp(arm)
+    return _ARM_STAMP
+
+
+def _player_shadow(width: int) -> pygame.Surface:
+    shadow = _PLAYER_SHADOWS.get(width)
+    if shadow is None:
+        shadow = pygame.Surface((width, 18), pygame.SRCALPHA)
+        pygame.draw.ellipse(shadow, PLAYER_SHADOW, shadow.get_rect())
+        shadow = _PLAYER_SHADOWS[width] = finish_stamp(shadow)
+    return shadow
+
+
+_SHIELD_HALOS: dict[int, Tuple[pygame.Surface, pygame.Surface]] = {}
+
+
+def _player_shield_halo(radius: int) -> Tuple[pygame.Surface, pygame.Surface]:
+    halo = _SHIELD_HALOS.get(radius)
+    if halo is None:
+        size = (radius * 2, radius * 2)
+        ring = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.circle(ring, (150, 230, 255), (radius, radius), radius, 3)
+        inner = glow_disc(size, (radius, radius), max(8, radius - 10), (90, 180, 255, 60))
+        halo = (finish_stamp(ring), inner)
+        _SHIELD_HALOS[radius] = halo
+    return halo
+
+
+@dataclass(slots=True)
 class Player:
     rect: pygame.Rect
     vel: pygame.Vector2 = field(default_factory=lambda: pygame.Vector2(0, 0))
@@ -683,21 +1155,21 @@ class Player:
 
     def move(self, direction: float, dt: float, depth_direction: float = 0.0) -> None:
         if self.three_d_mode:
-            frame_scale = clamp(dt * FPS, 0.0, 2.0)
+            # frame_scale tops out at 2.0, so the blend factors below never leave [0, 1].
+            blend = max(0.0, min(dt * FPS, 2.0)) * 0.5
             target_x = direction * PLAYER_SPEED * 1.05
-            self.vel.x = lerp(self.vel.x, target_x, clamp(frame_scale * 0.5, 0.0, 1.0))
+            self.vel.x += (target_x - self.vel.x) * blend
             if abs(self.vel.x) < 0.05:
                 self.vel.x = 0.0
             if direction:
                 self.facing = 1 if direction > 0 else -1
             target_depth = depth_direction * PLAYER_SPEED * 0.9
-            self.depth_vel = lerp(self.depth_vel, target_depth, clamp(frame_scale * 0.5, 0.0, 1.0))
+            self.depth_vel += (target_depth - self.depth_vel) * blend
             if abs(self.depth_vel) < 0.05:
                 self.depth_vel = 0.0
             return
-        frame_scale = clamp(dt * FPS, 0.0, 1.5)
         target = direction * PLAYER_SPEED
-        self.vel.x = lerp(self.vel.x, target, clamp(frame_scale * 0.35, 0.0, 1.0))
+        self.vel.x += (target - self.vel.x) * (max(0.0, min(dt * FPS, 1.5)) * 0.35)
         if abs(self.vel.x) < 0.05:
             self.vel.x = 0.0
         if direction:
@@ -722,17 +1194,23 @@ class Player:
         self.airborne_time = 0.0
         self._pending_double_jump_effect = True
 
-    def update(self, platforms: Sequence[Platform], dt: float) -> List[Particle]:
+    def update(
+        self,
+        platforms: Sequence[Platform],
+        dt: float,
+        platform_rects: Sequence[pygame.Rect] | None = None,
+    ) -> List[Particle]:
         particles: List[Particle] = []
         if self.three_d_mode:
             return self._update_three_d(dt)
-        if self.ground_platform and isinstance(self.ground_platform, MovingPlatform):
-            motion = self.ground_platform.last_move
-            if motion.x or motion.y:
-                self._float_pos.x += motion.x
-                self._float_pos.y += motion.y
+        if self.ground_platform is not None and self.ground_platform.is_moving:
+            move_x = self.ground_platform.last_move_x
+            move_y = self.ground_platform.last_move_y
+            if move_x or move_y:
+                self._float_pos.x += move_x
+                self._float_pos.y += move_y
                 self.rect.topleft = (int(round(self._float_pos.x)), int(round(self._float_pos.y)))
-        frame_scale = clamp(dt * FPS, 0.0, 2.0)
+        frame_scale = max(0.0, min(dt * FPS, 2.0))
         previous_bottom = self.rect.bottom
         previous_top = self.rect.top
         was_on_ground = self.on_ground
@@ -740,16 +1218,17 @@ class Player:
         self.apply_gravity(frame_scale)
         self.vel.y = min(self.vel.y, MAX_FALL_SPEED)
         self._pending_bounce = None
-        self._resolve_initial_overlap(platforms)
+        rects = platform_rects if platform_rects is not None else [platform.rect for platform in platforms]
+        self._resolve_initial_overlap(platforms, rects)
 
         delta_x = self.vel.x * frame_scale
         if delta_x != 0.0:
-            self._horizontal_collisions(platforms, delta_x)
+            self._horizontal_collisions(platforms, rects, delta_x)
         else:
             self._float_pos.x = float(self.rect.x)
 
         delta_y = self.vel.y * frame_scale
-        landed = self._vertical_collisions(platforms, delta_y, previous_bottom, previous_top, was_on_ground)
+        landed = self._vertical_collisions(platforms, rects, delta_y, previous_bottom, previous_top, was_on_ground)
 
         if self.on_ground:
             self.airborne_time = 0.0
@@ -761,20 +1240,20 @@ class Player:
             particles.extend(self.emit_bounce_particles(self._pending_bounce))
             self._pending_bounce = None
         if self.invincible_timer > 0:
-            self.invincible_timer = max(0.0, self.invincible_timer - dt)
+            self.invincible_timer = self.invincible_timer - dt if self.invincible_timer > dt else 0.0
         if self.sword_cooldown > 0:
-            self.sword_cooldown = max(0.0, self.sword_cooldown - dt)
+            self.sword_cooldown = self.sword_cooldown - dt if self.sword_cooldown > dt else 0.0
         if self.sword_cooldown <= 0:
             self.sword_ready = self.sword_charges > 0
         return particles
 
     def _update_three_d(self, dt: float) -> List[Particle]:
-        frame_scale = clamp(dt * FPS, 0.0, 2.0)
+        frame_scale = max(0.0, min(dt * FPS, 2.0))
         self.animation_time += dt
         if self.invincible_timer > 0:
-            self.invincible_timer = max(0.0, self.invincible_timer - dt)
+            self.invincible_timer = self.invincible_timer - dt if self.invincible_timer > dt else 0.0
         if self.sword_cooldown > 0:
-            self.sword_cooldown = max(0.0, self.sword_cooldown - dt)
+            self.sword_cooldown = self.sword_cooldown - dt if self.sword_cooldown > dt else 0.0
         if self.sword_cooldown <= 0:
             self.sword_ready = self.sword_charges > 0
 
@@ -782,7 +1261,7 @@ class Player:
         if self.three_d_bounds:
             min_x = self.three_d_bounds.left
             max_x = max(min_x, self.three_d_bounds.right - self.rect.width)
-            proposed_x = clamp(proposed_x, min_x, max_x)
+            proposed_x = max(min_x, min(proposed_x, max_x))
         trial_rect = self.rect.copy()
         trial_rect.x = int(round(proposed_x))
         if self._collides_three_d(trial_rect):
@@ -795,7 +1274,7 @@ class Player:
         min_depth, max_depth = self.three_d_depth_bounds
         if min_depth > max_depth:
             min_depth, max_depth = max_depth, min_depth
-        proposed_depth = clamp(proposed_depth, min_depth, max_depth)
+        proposed_depth = max(min_depth, min(proposed_depth, max_depth))
         trial_rect.y = int(round(self.base_plane_y + proposed_depth))
         if self._collides_three_d(trial_rect):
             self.depth_vel = 0.0
@@ -809,75 +1288,77 @@ class Player:
         return []
 
     def _collides_three_d(self, rect: pygame.Rect) -> bool:
-        for obstacle in self.three_d_obstacles:
-            if rect.colliderect(obstacle):
-                return True
-        return False
+        return rect.collidelist(self.three_d_obstacles) >= 0
 
-    def _resolve_initial_overlap(self, platforms: Sequence[Platform]) -> None:
+    def _resolve_initial_overlap(self, platforms: Sequence[Platform], rects: Sequence[pygame.Rect]) -> None:
         attempts = 0
         while attempts < 4:
-            overlap_found = False
-            for platform in platforms:
-                if not self.rect.colliderect(platform.rect):
-                    continue
-                overlap = self.rect.clip(platform.rect)
-                if overlap.width <= 0 or overlap.height <= 0:
-                    continue
-                overlap_found = True
-                if overlap.width < overlap.height:
-                    if self.rect.centerx < platform.rect.centerx:
-                        self.rect.right = platform.rect.left
-                    else:
-                        self.rect.left = platform.rect.right
-                    self._float_pos.x = float(self.rect.x)
-                    self.vel.x = 0.0
-                    self.ground_platform = None
-                else:
-                    if self.rect.centery < platform.rect.centery:
-                        self.rect.bottom = platform.rect.top
-                        self.on_ground = True
-                        self.ground_platform = platform
-                    else:
-                        self.rect.top = platform.rect.bottom
-                        self.ground_platform = None
-                    self._float_pos.y = float(self.rect.y)
-                    self.vel.y = 0.0
-                break
-            if not overlap_found:
+            # First overlap in list order.
+            index = self.rect.collidelist(rects)
+            if index < 0:
                 break
+            platform = platforms[index]
+            other = rects[index]
+            left, right = self.rect.left, self.rect.right
+            top, bottom = self.rect.top, self.rect.bottom
+            overlap_width = min(right, other.right) - max(left, other.left)
+            overlap_height = min(bottom, other.bottom) - max(top, other.top)
+            if overlap_width < overlap_height:
+                if self.rect.centerx < other.centerx:
+                    self.rect.right = other.left
+                else:
+                    self.rect.left = other.right
+                self._float_pos.x = float(self.rect.x)
+                self.vel.x = 0.0
+                self.ground_platform = None
+            else:
+                if self.rect.centery < other.centery:
+                    self.rect.bottom = other.top
+                    self.on_ground = True
+                    self.ground_platform = platform
+                else:
+                    self.rect.top = other.bottom
+                    self.ground_platform = None
+                self._float_pos.y = float(self.rect.y)
+                self.vel.y = 0.0
             attempts += 1
 
-    def _horizontal_collisions(self, platforms: Sequence[Platform], delta_x: float) -> None:
+    def _horizontal_collisions(
+        self,
+        platforms: Sequence[Platform],
+        rects: Sequence[pygame.Rect],
+        delta_x: float,
+    ) -> None:
         left = self._float_pos.x
         right = left + self.rect.width
         top = self.rect.top
-        bottom = self.rect.bottom
+        height = self.rect.height
         target_left = left + delta_x
         target_right = right + delta_x
         move = delta_x
         collided: Platform | None = None
 
+        # One pixel wider than the float sweep each side; hits get the exact test.
         if delta_x > 0:
-            for platform in platforms:
-                rect = platform.rect
-                if bottom <= rect.top or top >= rect.bottom:
-                    continue
+            sweep_left = int(right) - 1
+            sweep = pygame.Rect(sweep_left, top, int(target_right) + 2 - sweep_left, height)
+            for index in sweep.collidelistall(rects):
+                rect = rects[index]
                 if right <= rect.left and target_right > rect.left:
                     distance = rect.left - right
                     if distance < move:
                         move = max(distance, 0.0)
-                        collided = platform
+                        collided = platforms[index]
         else:
-            for platform in platforms:
-                rect = platform.rect
-                if bottom <= rect.top or top >= rect.bottom:
-                    continue
+            sweep_left = int(target_left) - 1
+            sweep = pygame.Rect(sweep_left, top, int(left) + 2 - sweep_left, height)
+            for index in sweep.collidelistall(rects):
+                rect = rects[index]
                 if left >= rect.right and target_left < rect.right:
                     distance = rect.right - left
                     if distance > move:
                         move = min(distance, 0.0)
-                        collided = platform
+                        collided = platforms[index]
 
         self._float_pos.x += move
         self.rect.x = int(round(self._float_pos.x))
@@ -892,6 +1373,7 @@ class Player:
     def _vertical_collisions(
         self,
         platforms: Sequence[Platform],
+        rects: Sequence[pygame.Rect],
         delta_y: float,
         previous_bottom: int,
         previous_top: int,
@@ -902,7 +1384,7 @@ class Player:
             return False
 
         left = self.rect.left
-        right = self.rect.right
+        width = self.rect.width
         top = self._float_pos.y
         bottom = top + self.rect.height
         target_top = top + delta_y
@@ -912,25 +1394,25 @@ class Player:
         landed = False
 
         if delta_y > 0:
-            for platform in platforms:
-                rect = platform.rect
-                if right <= rect.left or left >= rect.right:
-                    continue
+            sweep_top = int(bottom) - 1
+            sweep = pygame.Rect(left, sweep_top, width, int(target_bottom) + 2 - sweep_top)
+            for index in sweep.collidelistall(rects):
+                rect = rects[index]
                 if bottom <= rect.top and target_bottom > rect.top:
                     gap = rect.top - bottom
                     if gap < move:
                         move = max(gap, 0.0)
-                        collided = platform
+                        collided = platforms[index]
         else:
-            for platform in platforms:
-                rect = platform.rect
-                if right <= rect.left or left >= rect.right:
-                    continue
+            sweep_top = int(target_top) - 1
+            sweep = pygame.Rect(left, sweep_top, width, int(top) + 2 - sweep_top)
+            for index in sweep.collidelistall(rects):
+                rect = rects[index]
                 if top >= rect.bottom and target_top < rect.bottom:
                     gap = rect.bottom - top
                     if gap > move:
                         move = min(gap, 0.0)
-                        collided = platform
+                        collided = platforms[index]
 
         self._float_pos.y += move
         self.rect.y = int(round(self._float_pos.y))
@@ -958,14 +1440,12 @@ class Player:
                 self.vel.y = 0.0
                 ground_platform = None
         else:
-            for platform in platforms:
-                if not self.rect.colliderect(platform.rect):
-                    continue
-                overlap = self.rect.clip(platform.rect)
-                if overlap.height <= 0:
-                    continue
-                if self.rect.centery <= platform.rect.centery:
-                    self.rect.bottom = platform.rect.top
+            index = self.rect.collidelist(rects)
+            if index >= 0:
+                platform = platforms[index]
+                other = rects[index]
+                if self.rect.centery <= other.centery:
+                    self.rect.bottom = other.top
                     self._float_pos.y = float(self.rect.y)
                     if platform.is_bouncy:
                         self.vel.y = platform.bounce_velocity
@@ -976,15 +1456,13 @@ class Player:
                         self.vel.y = 0.0
                         self.on_ground = True
                         ground_platform = platform
-                        if not was_on_ground and previous_bottom <= platform.rect.top + 2:
+                        if not was_on_ground and previous_bottom <= other.top + 2:
                             landed = True
-                    break
                 else:
-                    self.rect.top = platform.rect.bottom
+                    self.rect.top = other.bottom
                     self._float_pos.y = float(self.rect.y)
                     self.vel.y = 0.0
                     ground_platform = None
-                    break
 
         if self.on_ground and self.vel.y > 0:
             self.vel.y = 0.0
@@ -995,69 +1473,21 @@ class Player:
         return landed
 
     def _spawn_landing_particles(self) -> List[Particle]:
-        particles = []
-        for _ in range(10):
-            speed = random.uniform(150, 260)
-            angle = random.uniform(math.pi, math.tau)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-            particles.append(
-                Particle(
-                    pos=pygame.Vector2(self.rect.centerx, self.rect.bottom - 4),
-                    vel=vel,
-                    life=random.uniform(0.2, 0.55),
-                    colour=GRASS,
-                    radius=random.uniform(2, 5),
-                )
-            )
-        return particles
+        return emit_burst(self.rect.centerx, self.rect.bottom - 4, 10, (150, 260), (0.2, 0.55), (2, 5),
+                          GRASS, arc=(math.pi, math.tau))
 
     def emit_jump_particles(self) -> List[Particle]:
-        particles = []
-        for _ in range(6):
-            vel = pygame.Vector2(random.uniform(-90, 90), random.uniform(-10, -160))
-            particles.append(
-                Particle(
-                    pos=pygame.Vector2(self.rect.centerx, self.rect.bottom),
-                    vel=vel,
-                    life=random.uniform(0.3, 0.6),
-                    colour=CYAN,
-                    radius=random.uniform(2, 4),
-                )
-            )
-        return particles
+        return emit_spray(self.rect.centerx, self.rect.bottom, 6, (0, 0), (-90, 90), (-160, -10),
+                          (0.3, 0.6), (2, 4), CYAN)
 
     def emit_wind_gust(self) -> List[Particle]:
-        gusts: List[Particle] = []
-        for _ in range(5):
-            vel = pygame.Vector2(random.uniform(-50, 50), random.uniform(140, 220))
-            gusts.append(
-                Particle(
-                    pos=pygame.Vector2(self.rect.centerx + random.uniform(-12, 12), self.rect.bottom + 6),
-                    vel=vel,
-                    life=random.uniform(0.25, 0.45),
-                    colour=SMOKE,
-                    radius=random.uniform(3, 5),
-                )
-            )
-        return gusts
+        return emit_spray(self.rect.centerx, self.rect.bottom + 6, 5, (-12, 12), (-50, 50), (140, 220),
+                          (0.25, 0.45), (3, 5), SMOKE)
 
     def emit_bounce_particles(self, platform: Platform) -> List[Particle]:
-        bursts: List[Particle] = []
-        base_colour = BOUNCY_TOP if platform.is_bouncy else CYAN
-        for _ in range(12):
-            angle = random.uniform(math.pi, math.tau)
-            speed = random.uniform(180, 320)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-            bursts.append(
-                Particle(
-                    pos=pygame.Vector2(self.rect.centerx, platform.rect.top),
-                    vel=vel,
-                    life=random.uniform(0.25, 0.55),
-                    colour=base_colour,
-                    radius=random.uniform(2.5, 5),
-                )
-            )
-        return bursts
+        colour = BOUNCY_TOP if platform.is_bouncy else CYAN
+        return emit_burst(self.rect.centerx, platform.rect.top, 12, (180, 320), (0.25, 0.55), (2.5, 5),
+                          colour, arc=(math.pi, math.tau))
 
     def perform_sword_attack(self) -> SwordBeam:
         width = SWORD_BEAM_LENGTH
@@ -1079,8 +1509,7 @@ class Player:
         flicker = self.invincible_timer > 0 and int(self.invincible_timer * 30) % 2 == 0
 
         if self.three_d_mode:
-            shadow_surface = pygame.Surface((self.rect.width + 30, 18), pygame.SRCALPHA)
-            pygame.draw.ellipse(shadow_surface, pygame.Color(0, 0, 0, 110), shadow_surface.get_rect())
+            shadow_surface = _player_shadow(self.rect.width + 30)
             shadow_rect = shadow_surface.get_rect(center=(offset.centerx, offset.bottom - 4))
             surface.blit(shadow_surface, shadow_rect)
 
@@ -1096,91 +1525,50 @@ class Player:
             suit_base.height = max(26, int(suit_base.height * height_scale))
             suit_base.center = centre
 
-        run_phase = math.sin(self.animation_time * 12.0) * min(1.0, abs(self.vel.x) / (PLAYER_SPEED + 1e-3))
-        bob = -run_phase * 3.0 if self.on_ground and abs(self.vel.x) > 0.4 else 0.0
+        speed_x = abs(self.vel.x)
+        running = self.on_ground and speed_x > 0.4
+        if running:
+            run_phase = math.sin(self.animation_time * 12.0) * min(1.0, speed_x / (PLAYER_SPEED + 1e-3))
+            bob = -run_phase * 3.0
+        else:
+            bob = 0.0
         if not self.on_ground:
-            stretch = clamp(-self.vel.y * 0.04, -0.3, 0.5)
+            stretch = max(-0.3, min(-self.vel.y * 0.04, 0.5))
             suit_base = suit_base.inflate(-6, -int(16 * stretch))
             bob -= stretch * 6
-        suit_base.y += int(round(bob))
+        suit_base.y += _floor(bob + 0.5)
 
-        torso_surface = pygame.Surface(suit_base.size, pygame.SRCALPHA)
-        torso_rect = torso_surface.get_rect()
-        pygame.draw.rect(torso_surface, pygame.Color(90, 150, 255), torso_rect, border_radius=16)
-        chestplate = pygame.Rect(6, 10, torso_rect.width - 12, torso_rect.height - 18)
-        pygame.draw.rect(torso_surface, pygame.Color(140, 200, 255), chestplate, border_radius=12)
-        glow_colour = pygame.Color(40, 70, 200, 180)
-        pygame.draw.rect(torso_surface, glow_colour, chestplate.inflate(-16, -16), border_radius=10)
-        if flicker:
-            torso_surface.fill((255, 255, 255, 90), special_flags=pygame.BLEND_RGBA_ADD)
-        surface.blit(torso_surface, suit_base.topleft)
+        surface.blit(_player_torso(suit_base.size, flicker), suit_base.topleft)
 
-        visor = pygame.Rect(suit_base.centerx - 24, suit_base.top + 6, 48, 18)
-        pygame.draw.rect(surface, pygame.Color(40, 50, 120), visor, border_radius=10)
-        visor_glow = pygame.Surface((visor.width, visor.height), pygame.SRCALPHA)
-        pygame.draw.rect(visor_glow, pygame.Color(100, 200, 255, 160), visor_glow.get_rect(), border_radius=10)
-        surface.blit(visor_glow, visor)
-        eye_y = visor.centery
-        gaze = int(6 * self.facing)
-        pygame.draw.circle(surface, MIDNIGHT, (visor.centerx - 12 + gaze, eye_y), 4)
-        pygame.draw.circle(surface, MIDNIGHT, (visor.centerx + 12 + gaze, eye_y), 4)
-
-        jet_rect = pygame.Rect(suit_base.left + 10, suit_base.bottom - 8, suit_base.width - 20, 6)
-        pygame.draw.rect(surface, pygame.Color(255, 255, 255, 160), jet_rect, border_radius=3)
-        exhaust = pygame.Rect(jet_rect.left, jet_rect.bottom, jet_rect.width, 10)
-        pygame.draw.rect(surface, pygame.Color(120, 200, 255, 160), exhaust, border_radius=3)
-
-        leg_colour = pygame.Color(60, 80, 150)
-        foot_y = suit_base.bottom + 4
-        if self.on_ground and abs(self.vel.x) > 0.4:
-            stride = math.sin(self.animation_time * 16)
-            spread = 16
-            pygame.draw.circle(surface, leg_colour, (suit_base.centerx - int(stride * spread), foot_y), 7)
-            pygame.draw.circle(surface, leg_colour, (suit_base.centerx + int(stride * spread), foot_y), 7)
+        surface.blit(_player_visor(int(6 * self.facing)), (suit_base.centerx - 24, suit_base.top + 6))
+
+        if running:
+            stride = int(math.sin(self.animation_time * 16) * 16)
         else:
-            pygame.draw.circle(surface, leg_colour, (suit_base.centerx - 8, foot_y), 7)
-            pygame.draw.circle(surface, leg_colour, (suit_base.centerx + 8, foot_y), 7)
+            stride = 8
+        surface.blit(_player_legs(suit_base.width, stride), (suit_base.left - LEG_STAMP_PAD, suit_base.bottom - 8))
 
-        arm_colour = pygame.Color(180, 170, 255)
-        sway = math.sin(self.animation_time * 14) * 6 if self.on_ground and abs(self.vel.x) > 0.5 else 0
-        left_arm = pygame.Rect(suit_base.left - 10, suit_base.top + 20 + sway, 18, 24)
-        right_arm = pygame.Rect(suit_base.right - 8, suit_base.top + 20 - sway, 18, 24)
-        pygame.draw.ellipse(surface, arm_colour, left_arm)
-        pygame.draw.ellipse(surface, arm_colour, right_arm)
+        sway = math.sin(self.animation_time * 14) * 6 if running and speed_x > 0.5 else 0
+        arm = _player_arm()
+        surface.blit(arm, (suit_base.left - 10, int(suit_base.top + 20 + sway)))
+        surface.blit(arm, (suit_base.right - 8, int(suit_base.top + 20 - sway)))
 
         if self.shield_charges > 0:
             shield_radius = max(suit_base.width, suit_base.height) + 14
-            shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-            shimmer = int(120 + 60 * math.sin(self.animation_time * 8.0))
-            pygame.draw.circle(
-                shield_surface,
-                (150, 230, 255, shimmer),
-                (shield_radius, shield_radius),
-                shield_radius,
-                3,
-            )
-            inner_radius = max(8, shield_radius - 10)
-            pygame.draw.circle(
-                shield_surface,
-                (90, 180, 255, 60),
-                (shield_radius, shield_radius),
-                inner_radius,
-            )
-            surface.blit(shield_surface, shield_surface.get_rect(center=suit_base.center))
+            ring, inner = _player_shield_halo(shield_radius)
+            ring.set_alpha(int(120 + 60 * math.sin(self.animation_time * 8.0)))
+            corner = (suit_base.centerx - shield_radius, suit_base.centery - shield_radius)
+            surface.blit(inner, corner)
+            surface.blit(ring, corner)
 
         if self.sword_ready:
             glow_radius = max(suit_base.width, suit_base.height)
-            glow = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                glow,
-                (NEON_GREEN.r, NEON_GREEN.g, NEON_GREEN.b, 90),
-                (glow_radius, glow_radius),
-                glow_radius,
-            )
-            surface.blit(glow, glow.get_rect(center=suit_base.center))
+            glow = glow_disc((glow_radius * 2, glow_radius * 2), (glow_radius, glow_radius), glow_radius,
+                             (NEON_GREEN.r, NEON_GREEN.g, NEON_GREEN.b, 90))
+            surface.blit(glow, (suit_base.centerx - glow_radius, suit_base.centery - glow_radius))
 
 
-@dataclass
+@dataclass(slots=True)
 class Projectile:
     pos: pygame.Vector2
     vel: pygame.Vector2
@@ -1188,144 +1576,288 @@ class Projectile:
     colour: pygame.Color = field(default_factory=lambda: EMBER.copy())
     life: float = 4.0
 
-    def update(self, dt: float) -> bool:
-        self.pos += self.vel * dt
-        self.life -= dt
-        return self.life > 0
-
     @property
     def rect(self) -> pygame.Rect:
         size = int(self.radius * 2)
         return pygame.Rect(int(self.pos.x - self.radius), int(self.pos.y - self.radius), size, size)
 
+
+_FREE_PROJECTILES: List[Projectile] = []
+
+
+def acquire_projectile(x: float, y: float, vx: float, vy: float, radius: float,
+                       colour: pygame.Color, life: float = 4.0) -> Projectile:
+    if _FREE_PROJECTILES:
+        projectile = _FREE_PROJECTILES.pop()
+        projectile.pos.xy = (x, y)
+        projectile.vel.xy = (vx, vy)
+        projectile.radius = radius
+        projectile.colour = colour
+        projectile.life = life
+        return projectile
+    return Projectile(pygame.Vector2(x, y), pygame.Vector2(vx, vy), radius, colour, life)
+
+
+def release_projectiles(projectiles: Sequence[Projectile]) -> None:
+    room = FREE_LIST_LIMIT - len(_FREE_PROJECTILES)
+    if room > 0:
+        _FREE_PROJECTILES.extend(projectiles[:room])
+
+
+class ProjectilePool:
+    def __init__(self) -> None:
+        self.items: List[Projectile] = []
+
+    def __iter__(self) -> Iterator[Projectile]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def extend(self, projectiles: Sequence[Projectile]) -> None:
+        self.items.extend(projectiles)
+
+    def remove(self, projectile: Projectile) -> None:
+        self.items.remove(projectile)
+        release_projectiles((projectile,))
+
+    def remove_all(self, projectiles: Sequence[Projectile]) -> None:
+        doomed = {id(projectile) for projectile in projectiles}
+        self.items = [projectile for projectile in self.items if id(projectile) not in doomed]
+        release_projectiles(projectiles)
+
+    def clear(self) -> None:
+        self.items.clear()
+
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
-        centre = (int(self.pos.x - camera_x), int(self.pos.y))
-        pygame.draw.circle(surface, self.colour, centre, int(self.radius))
-        tail_end = (centre[0] - int(self.vel.x * 0.06), centre[1] - int(self.vel.y * 0.06))
-        pygame.draw.line(surface, pygame.Color(255, 200, 160), centre, tail_end, 3)
+        circle = pygame.draw.circle
+        line = pygame.draw.line
+        view_right = SCREEN_WIDTH
+        for projectile in self.items:
+            pos = projectile.pos
+            vel = projectile.vel
+            radius = projectile.radius
+            screen_x = pos.x - camera_x
+            reach = radius + abs(vel.x) * 0.06 + 2
+            if screen_x + reach <= 0 or screen_x - reach >= view_right:
+                continue
+            centre = (int(screen_x), int(pos.y))
+            circle(surface, projectile.colour, centre, int(radius))
+            line(surface, PROJECTILE_TAIL, centre,
+                 (centre[0] - int(vel.x * 0.06), centre[1] - int(vel.y * 0.06)), 3)
+
+    def update(self, dt: float, bounds: pygame.Rect, solids: Sequence[pygame.Rect]) -> List[Tuple[int, int]]:
+        # Returns the impact points of projectiles that struck a solid.
+        survivors: List[Projectile] = []
+        expired: List[Projectile] = []
+        impacts: List[Tuple[int, int]] = []
+        min_x, min_y, max_x, max_y = bounds.left, bounds.top, bounds.right, bounds.bottom
+        Rect = pygame.Rect
+        keep, drop = survivors.append, expired.append
+        for projectile in self.items:
+            pos = projectile.pos
+            vel = projectile.vel
+            x = pos.x + vel.x * dt
+            y = pos.y + vel.y * dt
+            pos.xy = (x, y)
+            projectile.life -= dt
+            if projectile.life <= 0:
+                drop(projectile)
+                continue
+            radius = projectile.radius
+            left = int(x - radius)
+            top = int(y - radius)
+            size = int(radius * 2)
+            if left + size < min_x or left > max_x or top > max_y or top + size < min_y:
+                drop(projectile)
+                continue
+            rect = Rect(left, top, size, size)
+            if rect.collidelist(solids) != -1:
+                impacts.append(rect.center)
+                drop(projectile)
+                continue
+            keep(projectile)
+        self.items = survivors
+        if expired:
+            release_projectiles(expired)
+        return impacts
+
+
+_SWORD_BEAM_GLOWS: dict[Tuple[int, int, bool, int], pygame.Surface] = {}
+
+
+def _sword_beam_glow(size: Tuple[int, int], facing_right: bool, band_intensity: int) -> pygame.Surface:
+    key = (size[0], size[1], facing_right, band_intensity)
+    glow = _SWORD_BEAM_GLOWS.get(key)
+    if glow is not None:
+        return glow
+    width, height = size
+    glow = pygame.Surface((width + 24, height + 24), pygame.SRCALPHA)
+    core_rect = glow.get_rect()
+    pygame.draw.rect(
+        glow,
+        pygame.Color(80, 255, 210, 180),
+        core_rect,
+        border_radius=16,
+    )
+    middle_rect = core_rect.inflate(-12, -8)
+    pygame.draw.rect(
+        glow,
+        pygame.Color(PLASMA_BLUE.r, PLASMA_BLUE.g, PLASMA_BLUE.b, band_intensity),
+        middle_rect,
+        border_radius=12,
+    )
+    core = middle_rect.inflate(-max(6, middle_rect.width // 5), -max(6, middle_rect.height // 3))
+    pygame.draw.rect(
+        glow,
+        pygame.Color(PLASMA_CORE.r, PLASMA_CORE.g, PLASMA_CORE.b, 220),
+        core,
+        border_radius=10,
+    )
+    stripe_height = max(2, core.height // 5)
+    for i in range(3):
+        stripe = pygame.Rect(core.left + 4, core.top + 6 + i * stripe_height * 2, core.width - 8, stripe_height)
+        pygame.draw.rect(
+            glow,
+            pygame.Color(255, 255, 255, 140 - i * 30),
+            stripe,
+            border_radius=4,
+        )
+    tip_width = max(12, height // 2)
+    tip_shape = pygame.Surface((tip_width, height + 20), pygame.SRCALPHA)
+    tip_height = tip_shape.get_height()
+    pygame.draw.polygon(
+        tip_shape,
+        pygame.Color(255, 255, 255, 160),
+        [
+            (0, tip_height // 2),
+            (tip_width - 2, 4),
+            (tip_width - 2, tip_height - 4),
+        ],
+    )
+    tip = tip_shape if facing_right else pygame.transform.flip(tip_shape, True, False)
+    glow.blit(
+        tip,
+        (
+            core.right - tip_width // 2 if facing_right else core.left - tip_width // 2,
+            (glow.get_height() - tip.get_height()) // 2,
+        ),
+        special_flags=pygame.BLEND_ADD,
+    )
+    glow = finish_stamp(glow)
+    _SWORD_BEAM_GLOWS[key] = glow
+    return glow
 
 
-@dataclass
+@dataclass(slots=True)
 class SwordBeam:
     rect: pygame.Rect
     facing: int
     life: float = SWORD_BEAM_DURATION
     speed: float = SWORD_BEAM_SPEED
     travelled: float = 0.0
-    _float_pos: pygame.Vector2 = field(init=False)
+    _float_x: float = field(init=False)
     phase: float = field(default_factory=lambda: random.random() * math.tau)
 
     def __post_init__(self) -> None:
-        self._float_pos = pygame.Vector2(self.rect.topleft)
+        self._float_x = float(self.rect.x)
 
     def update(self, dt: float) -> bool:
         advance = self.speed * dt
         self.travelled += advance
-        self._float_pos.x += advance * self.facing
-        self.rect.x = int(round(self._float_pos.x))
+        self._float_x += advance * self.facing
+        self.rect.x = _floor(self._float_x + 0.5)
         self.life -= dt
         self.phase = (self.phase + dt * 16.0) % math.tau
         return self.life > 0 and self.travelled < SWORD_BEAM_MAX_RANGE
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
+        surface.blits(self.sprites(camera_x), doreturn=False)
+
+    def sprites(self, camera_x: float) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
         offset = self.rect.move(-camera_x, 0)
         if offset.width <= 0 or offset.height <= 0:
-            return
-        glow = pygame.Surface((offset.width + 24, offset.height + 24), pygame.SRCALPHA)
-        core_rect = glow.get_rect()
-        pygame.draw.rect(
-            glow,
-            pygame.Color(80, 255, 210, 180),
-            core_rect,
-            border_radius=16,
-        )
+            return []
+        if offset.right + 16 <= 0 or offset.left - 16 >= SCREEN_WIDTH:
+            return []
         pulse = (math.sin(self.phase) + 1) * 0.5
         band_intensity = int(160 + 60 * pulse)
-        middle_rect = core_rect.inflate(-12, -8)
-        pygame.draw.rect(
-            glow,
-            pygame.Color(PLASMA_BLUE.r, PLASMA_BLUE.g, PLASMA_BLUE.b, band_intensity),
-            middle_rect,
-            border_radius=12,
-        )
-        core = middle_rect.inflate(-max(6, middle_rect.width // 5), -max(6, middle_rect.height // 3))
-        pygame.draw.rect(
-            glow,
-            pygame.Color(PLASMA_CORE.r, PLASMA_CORE.g, PLASMA_CORE.b, 220),
-            core,
-            border_radius=10,
-        )
-        stripe_height = max(2, core.height // 5)
-        for i in range(3):
-            stripe = pygame.Rect(core.left + 4, core.top + 6 + i * stripe_height * 2, core.width - 8, stripe_height)
-            pygame.draw.rect(
-                glow,
-                pygame.Color(255, 255, 255, 140 - i * 30),
-                stripe,
-                border_radius=4,
-            )
-        tip_width = max(12, offset.height // 2)
-        tip_shape = pygame.Surface((tip_width, offset.height + 20), pygame.SRCALPHA)
-        tip_height = tip_shape.get_height()
-        pygame.draw.polygon(
-            tip_shape,
-            pygame.Color(255, 255, 255, 160),
-            [
-                (0, tip_height // 2),
-                (tip_width - 2, 4),
-                (tip_width - 2, tip_height - 4),
-            ],
-        )
-        tip = tip_shape if self.facing > 0 else pygame.transform.flip(tip_shape, True, False)
-        glow.blit(
-            tip,
-            (
-                core.right - tip_width // 2 if self.facing > 0 else core.left - tip_width // 2,
-                (glow.get_height() - tip.get_height()) // 2,
-            ),
-            special_flags=pygame.BLEND_ADD,
-        )
+        glow = _sword_beam_glow(offset.size, self.facing > 0, band_intensity)
         jitter = math.sin(self.phase * 2.0) * 3.0
         glow_rect = glow.get_rect(center=offset.center)
         glow_rect.x += int(jitter * self.facing)
-        surface.blit(glow, glow_rect)
+        return [(glow, glow_rect.topleft)]
 
 
-@dataclass
+@dataclass(slots=True)
 class JumpSphereEffect:
     centre: pygame.Vector2
     width: float
     height: float
     timer: float = 0.35
     lifetime: float = 0.35
+    _canvas: Optional[pygame.Surface] = field(default=None, init=False, repr=False, compare=False)
 
     def update(self, dt: float) -> bool:
         self.timer -= dt
         return self.timer > 0
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
-        progress = clamp(self.timer / self.lifetime, 0.0, 1.0)
+        surface.blits(self.sprites(camera_x), doreturn=False)
+
+    def sprites(self, camera_x: float) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        progress = max(0.0, min(self.timer / self.lifetime, 1.0))
         radius_scale = 0.6 + 0.4 * progress
         alpha = int(180 * progress)
         size = (int(self.width * radius_scale), int(self.height * radius_scale))
-        ellipse_surface = pygame.Surface(size, pygame.SRCALPHA)
+        screen_x = self.centre.x - camera_x
+        if screen_x + size[0] <= 0 or screen_x - size[0] >= SCREEN_WIDTH:
+            return []
+        # The sphere only shrinks, so the canvas sized on the first frame is reused throughout.
+        canvas = self._canvas
+        if canvas is None or canvas.get_width() < size[0] or canvas.get_height() < size[1]:
+            canvas = self._canvas = pygame.Surface(size, pygame.SRCALPHA)
+        ellipse_surface = canvas.subsurface((0, 0) + size)
+        ellipse_surface.fill((0, 0, 0, 0))
         pygame.draw.ellipse(
             ellipse_surface,
-            pygame.Color(140, 230, 255, alpha),
+            (140, 230, 255, alpha),
             ellipse_surface.get_rect(),
             4,
         )
         fill = ellipse_surface.get_rect().inflate(-int(size[0] * 0.25), -int(size[1] * 0.35))
         pygame.draw.ellipse(
             ellipse_surface,
-            pygame.Color(200, 255, 255, int(alpha * 0.4)),
+            (200, 255, 255, int(alpha * 0.4)),
             fill,
         )
         draw_pos = (int(self.centre.x - camera_x - size[0] / 2), int(self.centre.y - size[1] / 2))
-        surface.blit(ellipse_surface, draw_pos)
+        return [(ellipse_surface, draw_pos)]
+
+_BOSS_BODIES: dict[Tuple[int, int, int], pygame.Surface] = {}
+
+
+def _boss_body(size: Tuple[int, int], glow_alpha: int) -> pygame.Surface:
+    key = (size[0], size[1], glow_alpha)
+    body = _BOSS_BODIES.get(key)
+    if body is None:
+        body = pygame.Surface(size, pygame.SRCALPHA)
+        body_rect = body.get_rect()
+        pygame.draw.ellipse(body, pygame.Color(150, 110, 255, 220), body_rect.inflate(-6, -6))
+        pygame.draw.ellipse(body, pygame.Color(90, 40, 200, glow_alpha), body_rect.inflate(-22, -18))
+        pygame.draw.circle(body, pygame.Color(255, 255, 255, 220), (body_rect.centerx, body_rect.centery - 6), 10)
+        mouth = pygame.Rect(0, 0, body_rect.width // 2, 10)
+        mouth.center = (body_rect.centerx, body_rect.centery + 18)
+        pygame.draw.ellipse(body, pygame.Color(30, 0, 60), mouth)
+        body = finish_stamp(body)
+        _BOSS_BODIES[key] = body
+    return body
+
 
-@dataclass
+@dataclass(slots=True)
 class Boss:
+    WAVE_PATTERN = tuple((offset * 90, 240 + abs(offset) * 30) for offset in (-2, -1, 0, 1, 2))
+
     rect: pygame.Rect
     anchors: List[pygame.Vector2]
     health: int = 5
@@ -1364,7 +1896,7 @@ class Boss:
         projectiles: List[Projectile] = []
         self.pulse = (self.pulse + dt * 5.2) % math.tau
         if self.defeated:
-            self.celebration_timer = max(0.0, self.celebration_timer - dt)
+            self.celebration_timer = self.celebration_timer - dt if self.celebration_timer > dt else 0.0
             return self.celebration_timer > 0, projectiles
 
         self._update_roaming(dt)
@@ -1375,7 +1907,7 @@ class Boss:
             projectiles.extend(self._spawn_waves(player_rect))
 
         if self.invulnerable > 0:
-            self.invulnerable = max(0.0, self.invulnerable - dt)
+            self.invulnerable = self.invulnerable - dt if self.invulnerable > dt else 0.0
 
         return True, projectiles
 
@@ -1421,42 +1953,51 @@ class Boss:
             self.move_timer = 0.0
 
     def _update_roaming(self, dt: float) -> None:
-        current = pygame.Vector2(self.rect.center)
-        distance = current.distance_to(self.roam_target)
-        if distance <= 8:
+        rect = self.rect
+        target = self.roam_target
+        current_x, current_y = rect.center
+        delta_x = target.x - current_x
+        delta_y = target.y - current_y
+        distance_sq = delta_x * delta_x + delta_y * delta_y
+        if distance_sq <= 64:
             if self.move_timer > 0:
-                self.move_timer = max(0.0, self.move_timer - dt)
+                self.move_timer = self.move_timer - dt if self.move_timer > dt else 0.0
                 if self.move_timer > 0:
                     return
             self._pick_new_roam_target()
             return
-        direction = self.roam_target - current
-        if direction.length_squared() <= 0:
-            return
-        direction = direction.normalize()
-        direction.y += math.sin(self.pulse * 1.6) * 0.04
-        step = direction * self.speed * dt
-        if step.length() > distance:
-            step = self.roam_target - current
-        self.rect.centerx += int(round(step.x))
-        self.rect.centery += int(round(step.y))
-        half_w = self.rect.width // 2
-        half_h = self.rect.height // 2
-        self.rect.centerx = int(
-            clamp(self.rect.centerx, self.roam_bounds.left + half_w, self.roam_bounds.right - half_w)
-        )
-        self.rect.centery = int(
-            clamp(self.rect.centery, self.roam_bounds.top + half_h, self.roam_bounds.bottom - half_h)
-        )
+        distance = math.sqrt(distance_sq)
+        stride = self.speed * dt
+        step_x = delta_x / distance * stride
+        step_y = (delta_y / distance + math.sin(self.pulse * 1.6) * 0.04) * stride
+        if step_x * step_x + step_y * step_y > distance_sq:
+            step_x, step_y = delta_x, delta_y
+        centre_x = current_x + _floor(step_x + 0.5)
+        centre_y = current_y + _floor(step_y + 0.5)
+        bounds = self.roam_bounds
+        half_w = rect.width // 2
+        half_h = rect.height // 2
+        high = bounds.right - half_w
+        if centre_x > high:
+            centre_x = high
+        low = bounds.left + half_w
+        if centre_x < low:
+            centre_x = low
+        high = bounds.bottom - half_h
+        if centre_y > high:
+            centre_y = high
+        low = bounds.top + half_h
+        if centre_y < low:
+            centre_y = low
+        rect.center = (centre_x, centre_y)
 
     def _spawn_waves(self, player_rect: pygame.Rect) -> List[Projectile]:
         projectiles: List[Projectile] = []
-        origin = pygame.Vector2(self.rect.centerx, self.rect.bottom - 12)
-        for offset in (-2, -1, 0, 1, 2):
-            vel = pygame.Vector2(offset * 90, 240 + abs(offset) * 30)
-            colour = pygame.Color(VOID_PURPLE)
-            projectiles.append(Projectile(pos=origin.copy(), vel=vel, radius=9, colour=colour, life=3.4))
-        sky_origin = pygame.Vector2(self.rect.centerx, self.rect.top + 6)
+        origin_x, origin_y = self.rect.centerx, self.rect.bottom - 12
+        for vel_x, vel_y in self.WAVE_PATTERN:
+            projectiles.append(
+                acquire_projectile(origin_x, origin_y, vel_x, vel_y, radius=9, colour=VOID_PURPLE, life=3.4)
+            )
         to_player = pygame.Vector2(player_rect.centerx - self.rect.centerx, player_rect.centery - self.rect.centery)
         if to_player.length_squared() > 1:
             to_player = to_player.normalize()
@@ -1464,13 +2005,14 @@ class Boss:
             to_player = pygame.Vector2(0, 1)
         to_player.y = max(to_player.y, 0.3)
         projectile_speed = 340
-        targeted_colour = pygame.Color(200, 160, 255)
         projectiles.append(
-            Projectile(
-                pos=sky_origin,
-                vel=to_player * projectile_speed,
+            acquire_projectile(
+                self.rect.centerx,
+                self.rect.top + 6,
+                to_player.x * projectile_speed,
+                to_player.y * projectile_speed,
                 radius=10,
-                colour=targeted_colour,
+                colour=BOSS_TARGETED_COLOUR,
                 life=3.6,
             )
         )
@@ -1490,24 +2032,18 @@ class Boss:
         if self.celebration_timer <= 0 and self.defeated:
             return
         offset = self.rect.move(-camera_x, 0)
-        body = pygame.Surface((offset.width + 20, offset.height + 20), pygame.SRCALPHA)
-        body_rect = body.get_rect()
-        base_colour = pygame.Color(150, 110, 255, 220)
-        pygame.draw.ellipse(body, base_colour, body_rect.inflate(-6, -6))
-        inner_rect = body_rect.inflate(-22, -18)
+        if offset.right + 60 <= 0 or offset.left - 60 >= SCREEN_WIDTH:
+            return
         glow_alpha = int(140 + 60 * math.sin(self.pulse))
-        pygame.draw.ellipse(body, pygame.Color(90, 40, 200, glow_alpha), inner_rect)
+        body = _boss_body((offset.width + 20, offset.height + 20), glow_alpha).copy()
+        body_rect = body.get_rect()
         eye_offset = int(10 + 4 * math.sin(self.pulse * 2))
-        pygame.draw.circle(body, pygame.Color(255, 255, 255, 220), (body_rect.centerx, body_rect.centery - 6), 10)
-        pygame.draw.circle(body, pygame.Color(40, 10, 80), (body_rect.centerx + eye_offset, body_rect.centery - 6), 6)
-        mouth = pygame.Rect(0, 0, body_rect.width // 2, 10)
-        mouth.center = (body_rect.centerx, body_rect.centery + 18)
-        pygame.draw.ellipse(body, pygame.Color(30, 0, 60), mouth)
+        pygame.draw.circle(body, BOSS_PUPIL, (body_rect.centerx + eye_offset, body_rect.centery - 6), 6)
 
         if self.invulnerable > 0 and not self.defeated:
             shield_rect = body_rect.inflate(16, 14)
             shield_alpha = int(80 + 80 * math.sin(self.invulnerable * 22))
-            pygame.draw.ellipse(body, pygame.Color(120, 220, 255, shield_alpha), shield_rect, 4)
+            pygame.draw.ellipse(body, (120, 220, 255, shield_alpha), shield_rect, 4)
         elif self.defeated:
             fade = clamp(self.celebration_timer / 1.2, 0.0, 1.0)
             body.fill((255, 255, 255, int(180 * fade)), special_flags=pygame.BLEND_RGBA_MULT)
@@ -1522,60 +2058,80 @@ class Boss:
         pip_y = offset.top - 24
         for i in range(max(self.health, 0)):
             pip_rect = pygame.Rect(start_x + i * (pip_width + pip_spacing), pip_y, pip_width, 8)
-            pygame.draw.rect(surface, pygame.Color(255, 210, 120), pip_rect, border_radius=4)
+            pygame.draw.rect(surface, BOSS_PIP, pip_rect, border_radius=4)
+
+def advance_pulses(tokens: Sequence, step: float) -> None:
+    tau = math.tau
+    for token in tokens:
+        if not token.collected:
+            token.pulse = (token.pulse + step) % tau
+
+
+def pickups_in_view(tokens: Sequence, left: float, right: float) -> list:
+    return [token for token in tokens
+            if not token.collected and token.rect.right >= left and token.rect.left <= right]
 
-@dataclass
+
+@dataclass(slots=True)
 class Coin:
+    PULSE_RATE = 4.0
+
     rect: pygame.Rect
     collected: bool = False
     pulse: float = field(default_factory=lambda: random.random() * math.tau)
 
     def update(self, dt: float) -> None:
-        self.pulse = (self.pulse + dt * 4.0) % math.tau
+        self.pulse = (self.pulse + dt * self.PULSE_RATE) % math.tau
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
         if self.collected:
             return
         offset = self.rect.move(-camera_x, 0)
+        if offset.right + offset.width <= 0 or offset.left - offset.width >= SCREEN_WIDTH:
+            return
         scale = 1 + 0.15 * math.sin(self.pulse)
         radius_x = int(self.rect.width * 0.5 * scale)
         radius_y = int(self.rect.height * 0.4 * scale)
         centre = offset.center
         glow_radius = int(max(radius_x, radius_y) * 1.6)
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (255, 235, 140, 120), (glow_radius, glow_radius), glow_radius)
-        surface.blit(glow_surface, glow_surface.get_rect(center=centre))
-        coin_colour = pygame.Color(255, 240, 100)
+        glow_size = glow_radius * 2
+        glow_surface = glow_disc((glow_size, glow_size), (glow_radius, glow_radius), glow_radius, (255, 235, 140, 120))
+        surface.blit(glow_surface, (centre[0] - glow_radius, centre[1] - glow_radius))
         coin_rect = pygame.Rect(centre[0] - radius_x, centre[1] - radius_y,
                                 radius_x * 2, radius_y * 2)
-        pygame.draw.ellipse(surface, coin_colour, coin_rect)
+        pygame.draw.ellipse(surface, COIN_GOLD, coin_rect)
         highlight_rect = pygame.Rect(centre[0] - radius_x // 2, centre[1] - radius_y,
                                      radius_x, radius_y)
         pygame.draw.ellipse(surface, WHITE, highlight_rect, 2)
         inner = pygame.Rect(centre[0] - radius_x // 3, centre[1] - radius_y // 2,
                              radius_x // 2, radius_y // 2)
-        pygame.draw.ellipse(surface, pygame.Color(255, 255, 255, 190), inner)
+        pygame.draw.ellipse(surface, COIN_SHINE, inner)
 
 
-@dataclass
+@dataclass(slots=True)
 class DoubleJumpPowerUp:
+    PULSE_RATE = 3.2
+
     rect: pygame.Rect
     pulse: float = field(default_factory=lambda: random.random() * math.tau)
     collected: bool = False
 
     def update(self, dt: float) -> None:
-        self.pulse = (self.pulse + dt * 3.2) % math.tau
+        self.pulse = (self.pulse + dt * self.PULSE_RATE) % math.tau
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
         if self.collected:
             return
         offset = self.rect.move(-camera_x, 0)
         halo_radius = max(offset.width, offset.height)
-        halo_surface = pygame.Surface((halo_radius * 2, halo_radius * 2), pygame.SRCALPHA)
-        intensity = int(90 + 60 * math.sin(self.pulse))
-        pygame.draw.circle(halo_surface, (120, 200, 255, intensity), (halo_radius, halo_radius), halo_radius)
+        if offset.right + halo_radius <= 0 or offset.left - halo_radius >= SCREEN_WIDTH:
+            return
+        halo_size = halo_radius * 2
+        halo_surface = glow_disc((halo_size, halo_size), (halo_radius, halo_radius), halo_radius, (120, 200, 255, 255))
+        wave = math.sin(self.pulse)
+        halo_surface.set_alpha(int(90 + 60 * wave))
         surface.blit(halo_surface, halo_surface.get_rect(center=offset.center))
-        rotation = math.sin(self.pulse) * 8
+        rotation = wave * 8
         diamond = [
             (offset.centerx, offset.top - 6),
             (offset.right + rotation * 0.5, offset.centery),
@@ -1592,21 +2148,25 @@ class DoubleJumpPowerUp:
         pygame.draw.polygon(surface, WHITE, inner, 2)
 
 
-@dataclass
+@dataclass(slots=True)
 class SwordPowerUp:
+    PULSE_RATE = 5.5
+
     rect: pygame.Rect
     pulse: float = field(default_factory=lambda: random.random() * math.tau)
     collected: bool = False
 
     def update(self, dt: float) -> None:
-        self.pulse = (self.pulse + dt * 5.5) % math.tau
+        self.pulse = (self.pulse + dt * self.PULSE_RATE) % math.tau
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
         if self.collected:
             return
         offset = self.rect.move(-camera_x, 0)
-        glow = pygame.Surface((offset.width + 18, offset.height + 18), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (255, 255, 255, 100), (glow.get_width() // 2, glow.get_height() // 2), glow.get_width() // 2)
+        if offset.right + 12 <= 0 or offset.left - 12 >= SCREEN_WIDTH:
+            return
+        glow_size = (offset.width + 18, offset.height + 18)
+        glow = glow_disc(glow_size, (glow_size[0] // 2, glow_size[1] // 2), glow_size[0] // 2, (255, 255, 255, 100))
         surface.blit(glow, glow.get_rect(center=offset.center))
         blade = pygame.Rect(0, 0, 8, offset.height)
         blade.center = offset.center
@@ -1617,32 +2177,38 @@ class SwordPowerUp:
         pygame.draw.rect(surface, STEEL, handle, border_radius=3)
 
 
-@dataclass
+@dataclass(slots=True)
 class ShieldPowerUp:
+    PULSE_RATE = 4.2
+
     rect: pygame.Rect
     pulse: float = field(default_factory=lambda: random.random() * math.tau)
     collected: bool = False
 
     def update(self, dt: float) -> None:
-        self.pulse = (self.pulse + dt * 4.2) % math.tau
+        self.pulse = (self.pulse + dt * self.PULSE_RATE) % math.tau
 
     def draw(self, surface: pygame.Surface, camera_x: float) -> None:
+        surface.blits(self.sprites(camera_x), doreturn=False)
+
+    def sprites(self, camera_x: float) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
         if self.collected:
-            return
+            return []
         offset = self.rect.move(-camera_x, 0)
-        halo = pygame.Surface((offset.width + 24, offset.height + 24), pygame.SRCALPHA)
-        halo_radius = halo.get_width() // 2
+        if offset.right + 12 <= 0 or offset.left - 12 >= SCREEN_WIDTH:
+            return []
+        halo_size = (offset.width + 24, offset.height + 24)
+        halo_radius = halo_size[0] // 2
         alpha = int(130 + 70 * math.sin(self.pulse))
-        pygame.draw.circle(halo, (120, 220, 255, alpha), (halo_radius, halo_radius), halo_radius)
-        surface.blit(halo, halo.get_rect(center=offset.center))
+        halo = glow_disc(halo_size, (halo_radius, halo_radius), halo_radius, (120, 220, 255, alpha))
         gem = pygame.Surface(offset.size, pygame.SRCALPHA)
         pygame.draw.ellipse(gem, pygame.Color(180, 240, 255, 220), gem.get_rect())
         crest = gem.get_rect().inflate(-10, -14)
         pygame.draw.ellipse(gem, pygame.Color(60, 110, 200, 210), crest, 4)
         pygame.draw.ellipse(gem, pygame.Color(255, 255, 255, 160), crest.inflate(-8, -10))
-        surface.blit(gem, offset)
+        return [(halo, halo.get_rect(center=offset.center).topleft), (gem, offset.topleft)]
 
-@dataclass
+@dataclass(slots=True)
 class GoalFlag:
     rect: pygame.Rect
     flutter: float = 0.0
@@ -1671,7 +2237,7 @@ class GoalFlag:
             pygame.draw.circle(surface, RIFT_GLOW, orb_pos, 6)
             tail_start = (centre[0], offset.bottom)
             tail_end = (centre[0], offset.bottom + 60)
-            pygame.draw.line(surface, pygame.Color(150, 255, 255, 140), tail_start, tail_end, 4)
+            pygame.draw.line(surface, PORTAL_TAIL, tail_start, tail_end, 4)
         else:
             pygame.draw.rect(
                 surface,
@@ -1688,6 +2254,7 @@ class GoalFlag:
 
 
 def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
+    randint, random_unit, choice = rng.randint, rng.random, rng.choice
     segment_count = 6 + stage * 2
     min_y = 260
     max_y = 520
@@ -1701,11 +2268,11 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
         platform.colour = pygame.Color(BOUNCY_CORAL)
 
     def maybe_make_bouncy(platform: Platform, chance: float, strength: float = 1.0) -> None:
-        if not platform.is_bouncy and rng.random() < chance:
+        if not platform.is_bouncy and random_unit() < chance:
             mark_bouncy(platform, strength)
 
     platforms: List[Platform] = []
-    first_width = rng.randint(220, 280)
+    first_width = randint(220, 280)
     first_rect = pygame.Rect(0, max_y, first_width, platform_height)
     platforms.append(Platform(first_rect))
     spawn_point = (first_rect.left + 36, first_rect.top - 60)
@@ -1713,9 +2280,9 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
     current_y = first_rect.y
 
     for _ in range(segment_count):
-        gap = rng.randint(70, 120 + stage * 20)
-        width = rng.randint(160, 260 + stage * 20)
-        delta_y = rng.randint(-80 - stage * 10, 80 + stage * 10)
+        gap = randint(70, 120 + stage * 20)
+        width = randint(160, 260 + stage * 20)
+        delta_y = randint(-80 - stage * 10, 80 + stage * 10)
         current_y = int(clamp(current_y + delta_y, min_y, max_y))
         rect = pygame.Rect(current_right + gap, current_y, width, platform_height)
         new_platform = Platform(rect)
@@ -1723,35 +2290,42 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
         platforms.append(new_platform)
         current_right = rect.right
 
-    final_gap = rng.randint(80, 140)
-    final_width = rng.randint(220, 320)
-    final_y = int(clamp(current_y + rng.randint(-60, 60), min_y, max_y))
+    final_gap = randint(80, 140)
+    final_width = randint(220, 320)
+    final_y = int(clamp(current_y + randint(-60, 60), min_y, max_y))
     final_rect = pygame.Rect(current_right + final_gap, final_y, final_width, platform_height)
     platforms.append(Platform(final_rect))
     current_right = final_rect.right
 
     base_platforms = list(platforms)
+    # The ground run is laid left to right without overlaps, so both edges are sorted.
+    base_lefts = [platform.rect.left for platform in base_platforms]
 
     floating_platforms: List[Platform] = []
     for platform in base_platforms[1:-1]:
-        if rng.random() < 0.35 + 0.08 * stage:
-            float_width = rng.randint(90, 140)
+        if random_unit() < 0.35 + 0.08 * stage:
+            float_width = randint(90, 140)
             min_x = platform.rect.left + 20
             max_x = platform.rect.right - float_width - 20
             if max_x <= min_x:
                 continue
-            x = rng.randint(min_x, max_x)
-            target_top = platform.rect.y - rng.randint(110, 170 + stage * 10)
+            x = randint(min_x, max_x)
+            target_top = platform.rect.y - randint(110, 170 + stage * 10)
             y = int(clamp(target_top, min_y - 160, platform.rect.y - 90))
             if platform.rect.y - y < 80:
                 continue
             candidate_rect = pygame.Rect(x, y, float_width, 28)
             too_close = False
-            for existing in platforms:
-                overlap = min(candidate_rect.right, existing.rect.right) - max(candidate_rect.left, existing.rect.left)
+            index = bisect_left(base_lefts, candidate_rect.right) - 1
+            while index >= 0:
+                existing = base_platforms[index].rect
+                if existing.right <= candidate_rect.left:
+                    break
+                index -= 1
+                overlap = min(candidate_rect.right, existing.right) - max(candidate_rect.left, existing.left)
                 if overlap <= 0:
                     continue
-                vertical_gap = existing.rect.top - candidate_rect.bottom
+                vertical_gap = existing.top - candidate_rect.bottom
                 if 0 <= vertical_gap < 100 and overlap > float_width * 0.6:
                     too_close = True
                     break
@@ -1761,39 +2335,42 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
             maybe_make_bouncy(float_platform, base_bounce_chance + 0.08, bounce_multiplier + 0.05)
             floating_platforms.append(float_platform)
     platforms.extend(floating_platforms)
+    # Static platforms are final from here on.
+    platform_hitboxes = [platform.rect.inflate(-12, -12) for platform in platforms]
+    moving_hitboxes: List[pygame.Rect] = []
+
+    def is_blocked(rect: pygame.Rect) -> bool:
+        return rect.collidelist(platform_hitboxes) != -1 or rect.collidelist(moving_hitboxes) != -1
 
     def create_horizontal_platform() -> MovingPlatform | None:
         anchor_choices = base_platforms[1:-1] if len(base_platforms) > 2 else base_platforms
         if not anchor_choices:
             return None
-        anchor = rng.choice(anchor_choices)
-        width = rng.randint(100, 140)
+        anchor = choice(anchor_choices)
+        width = randint(100, 140)
         left_bound = anchor.rect.left + 20
         right_bound = anchor.rect.right - width - 20
         if right_bound <= left_bound:
             return None
-        start_x = rng.randint(left_bound, right_bound)
-        height_offset = rng.randint(80, 150)
+        start_x = randint(left_bound, right_bound)
+        height_offset = randint(80, 150)
         y = max(min_y - 60, anchor.rect.y - height_offset)
-        span_left = max(0, start_x - rng.randint(80, 160))
-        span_right = min(current_right - 40, start_x + width + rng.randint(80, 160))
+        span_left = max(0, start_x - randint(80, 160))
+        span_right = min(current_right - 40, start_x + width + randint(80, 160))
         if span_right - span_left <= width + 10:
             return None
+        start_rect = pygame.Rect(start_x, y, width, 26)
+        if is_blocked(start_rect):
+            return None
         speed = 2.0 + 0.4 * stage
         mp = MovingPlatform(
-            pygame.Rect(start_x, y, width, 26),
+            start_rect,
             bounds_x=(span_left, span_right),
             bounds_y=(y, y + 1),
             speed_x=speed,
             speed_y=0.0,
         )
         mp.colour = pygame.Color(160, 110, 90)
-        for other in platforms:
-            if mp.rect.colliderect(other.rect.inflate(-12, -12)):
-                return None
-        for other in moving_platforms:
-            if mp.rect.colliderect(other.rect.inflate(-12, -12)):
-                return None
         maybe_make_bouncy(mp, MOVING_BOUNCY_CHANCE, bounce_multiplier + 0.04)
         return mp
 
@@ -1801,33 +2378,30 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
         candidates = base_platforms[1:-1] if len(base_platforms) > 2 else base_platforms
         if not candidates:
             return None
-        anchor = rng.choice(candidates)
-        width = rng.randint(90, 130)
+        anchor = choice(candidates)
+        width = randint(90, 130)
         left_bound = anchor.rect.left + 20
         right_bound = anchor.rect.right - width - 20
         if right_bound <= left_bound:
             return None
-        start_x = rng.randint(left_bound, right_bound)
-        top = max(min_y - 200, anchor.rect.y - rng.randint(160, 220))
-        bottom = anchor.rect.y - rng.randint(70, 110)
+        start_x = randint(left_bound, right_bound)
+        top = max(min_y - 200, anchor.rect.y - randint(160, 220))
+        bottom = anchor.rect.y - randint(70, 110)
         if bottom - top < 60:
             return None
-        start_y = rng.randint(top, bottom - 40)
+        start_y = randint(top, bottom - 40)
+        start_rect = pygame.Rect(start_x, start_y, width, 26)
+        if is_blocked(start_rect):
+            return None
         speed = 1.2 + 0.3 * stage
         mp = MovingPlatform(
-            pygame.Rect(start_x, start_y, width, 26),
+            start_rect,
             bounds_x=(start_x, start_x + width),
             bounds_y=(top, bottom),
             speed_x=0.0,
             speed_y=speed,
         )
         mp.colour = pygame.Color(150, 105, 120)
-        for other in platforms:
-            if mp.rect.colliderect(other.rect.inflate(-12, -12)):
-                return None
-        for other in moving_platforms:
-            if mp.rect.colliderect(other.rect.inflate(-12, -12)):
-                return None
         maybe_make_bouncy(mp, MOVING_BOUNCY_CHANCE, bounce_multiplier + 0.06)
         return mp
 
@@ -1838,10 +2412,8 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
             platform = generator()
             if not platform:
                 continue
-            overlap = any(platform.rect.colliderect(other.rect.inflate(-12, -12)) for other in moving_platforms)
-            if overlap:
-                continue
             moving_platforms.append(platform)
+            moving_hitboxes.append(platform.rect.inflate(-12, -12))
             return True
         return False
 
@@ -1855,26 +2427,48 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
     attempts = 0
     while len(moving_platforms) < target_total and attempts < target_total * 6:
         attempts += 1
-        generator = create_vertical_platform if rng.random() < 0.4 else create_horizontal_platform
+        generator = create_vertical_platform if random_unit() < 0.4 else create_horizontal_platform
         try_add(generator)
 
     platforms_with_motion: List[Platform | MovingPlatform] = platforms + moving_platforms
 
+    # Bucketed by x column; each column is sorted by top edge.
+    column_width = 256
+    columns: dict[int, List[Platform | MovingPlatform]] = {}
+    for other in platforms_with_motion:
+        for column in range(other.rect.left // column_width, (other.rect.right - 1) // column_width + 1):
+            columns.setdefault(column, []).append(other)
+    column_tops: dict[int, List[int]] = {}
+    for column, bucket in columns.items():
+        bucket.sort(key=lambda platform: platform.rect.top)
+        column_tops[column] = [platform.rect.top for platform in bucket]
+    headroom_results: dict[Tuple[int, int], bool] = {}
+
     def has_low_headroom(surface: Platform | MovingPlatform, min_gap: int = 120) -> bool:
+        key = (id(surface), min_gap)
+        cached = headroom_results.get(key)
+        if cached is not None:
+            return cached
         surface_rect = surface.rect
-        for other in platforms_with_motion:
-            if other is surface:
-                continue
-            other_rect = other.rect
-            if other_rect.top >= surface_rect.top:
-                continue
-            horizontal_overlap = min(surface_rect.right, other_rect.right) - max(surface_rect.left, other_rect.left)
-            if horizontal_overlap <= 0:
+        blocked = False
+        for column in range(surface_rect.left // column_width, (surface_rect.right - 1) // column_width + 1):
+            bucket = columns.get(column)
+            if not bucket:
                 continue
-            vertical_gap = surface_rect.top - other_rect.bottom
-            if 0 <= vertical_gap < min_gap and horizontal_overlap > surface_rect.width * 0.4:
-                return True
-        return False
+            for index in range(bisect_left(column_tops[column], surface_rect.top)):
+                other = bucket[index]
+                other_rect = other.rect
+                horizontal_overlap = min(surface_rect.right, other_rect.right) - max(surface_rect.left, other_rect.left)
+                if horizontal_overlap <= 0:
+                    continue
+                vertical_gap = surface_rect.top - other_rect.bottom
+                if 0 <= vertical_gap < min_gap and horizontal_overlap > surface_rect.width * 0.4:
+                    blocked = True
+                    break
+            if blocked:
+                break
+        headroom_results[key] = blocked
+        return blocked
 
     enemies: List[Enemy] = []
     for platform in platforms[1:-1]:
@@ -1882,22 +2476,20 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
         patrol_right = platform.rect.right - 12
         if patrol_right - patrol_left < 50:
             continue
-        if rng.random() < 0.35 + 0.12 * stage and not has_low_headroom(platform, min_gap=110):
+        if random_unit() < 0.35 + 0.12 * stage and not has_low_headroom(platform, min_gap=110):
             size = 38 if stage == 0 else 42
-            x = rng.randint(patrol_left, patrol_right - size)
+            x = randint(patrol_left, patrol_right - size)
             rect = pygame.Rect(x, platform.rect.y - size, size, size)
-            speed = 1.3 + rng.random() * (0.6 + 0.4 * stage)
-            tough = stage >= 1 and rng.random() < 0.35
+            speed = int(1.3 + random_unit() * (0.6 + 0.4 * stage))
+            tough = stage >= 1 and random_unit() < 0.35
             hp = 2 if tough else 1
             enemies.append(Enemy(rect, (patrol_left, patrol_right), speed=speed, health=hp, max_health=hp))
 
     solid_rects = [p.rect for p in platforms_with_motion]
 
     def area_is_clear(area: pygame.Rect, ignore: pygame.Rect | None = None) -> bool:
-        for other in solid_rects:
-            if other is ignore:
-                continue
-            if area.colliderect(other):
+        for index in area.collidelistall(solid_rects):
+            if solid_rects[index] is not ignore:
                 return False
         return True
 
@@ -1910,33 +2502,35 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
         expanded.bottom = surface_rect.top - 4
         return area_is_clear(expanded, surface_rect)
 
+    anchors_by_top = sorted(platforms_with_motion, key=lambda platform: platform.rect.top)
+    anchor_tops = [platform.rect.top for platform in anchors_by_top]
+    max_vertical = 220 + stage * 10
+
     def is_surface_reachable(surface: Platform | MovingPlatform) -> bool:
-        if surface in base_platforms:
+        if id(surface) in base_ids:
             return True
         surface_rect = surface.rect
-        max_vertical = 220 + stage * 10
-        for anchor in platforms_with_motion:
-            if anchor is surface:
-                continue
-            anchor_rect = anchor.rect
-            if anchor_rect.top <= surface_rect.top:
-                continue
-            vertical_gap = anchor_rect.top - surface_rect.top
-            if vertical_gap > max_vertical:
-                continue
-            if anchor_rect.right + 40 < surface_rect.left:
-                continue
-            if anchor_rect.left - 40 > surface_rect.right:
-                continue
-            return True
+        reach_left = surface_rect.left - 40
+        reach_right = surface_rect.right + 40
+        first = bisect_right(anchor_tops, surface_rect.top)
+        last = bisect_right(anchor_tops, surface_rect.top + max_vertical)
+        for index in range(first, last):
+            anchor_rect = anchors_by_top[index].rect
+            if anchor_rect.right >= reach_left and anchor_rect.left <= reach_right:
+                return True
         return False
 
-    surfaces = [s for s in platforms_with_motion if has_coin_clearance(s.rect) and is_surface_reachable(s)]
+    base_ids = {id(platform) for platform in base_platforms}
+    # Platforms no longer move from here on, so both per-surface tests are evaluated once.
+    reachable = {id(s) for s in platforms_with_motion if is_surface_reachable(s)}
+    coin_clear = {id(s) for s in platforms_with_motion if has_coin_clearance(s.rect)}
+
+    surfaces = [s for s in platforms_with_motion if id(s) in coin_clear and id(s) in reachable]
     if len(surfaces) < 5:
-        fallback = [s for s in platforms_with_motion if is_surface_reachable(s)]
+        fallback = [s for s in platforms_with_motion if id(s) in reachable]
         surfaces = fallback or platforms_with_motion
     rng.shuffle(surfaces)
-    desired_coins = min(len(surfaces), rng.randint(5, 6))
+    desired_coins = min(len(surfaces), randint(5, 6))
     coins: List[Coin] = []
     for surface in surfaces[:desired_coins]:
         if has_low_headroom(surface, min_gap=110):
@@ -1958,14 +2552,14 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
         max_x = platform.rect.right - enemy_width - 20
         if max_x <= min_x:
             continue
-        x = rng.randint(min_x, max_x)
+        x = randint(min_x, max_x)
         rect = pygame.Rect(x, platform.rect.top - enemy_height, enemy_width, enemy_height)
         shooters.append(ShooterEnemy(rect))
         if len(shooters) >= shooter_goal:
             break
 
     double_jump_orbs: List[DoubleJumpPowerUp] = []
-    orb_candidates = [p for p in platforms_with_motion if has_coin_clearance(p.rect) and is_surface_reachable(p)]
+    orb_candidates = [p for p in platforms_with_motion if id(p) in coin_clear and id(p) in reachable]
     rng.shuffle(orb_candidates)
     for platform in orb_candidates:
         pu_rect = pygame.Rect(platform.rect.centerx - 18, platform.rect.top - 60, 36, 36)
@@ -1983,15 +2577,16 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
             double_jump_orbs.append(DoubleJumpPowerUp(pygame.Rect(anchor.rect.centerx - 18, anchor.rect.top - 60, 36, 36)))
 
     shield_tokens: List[ShieldPowerUp] = []
-    shield_candidates = [p for p in platforms_with_motion if has_coin_clearance(p.rect)]
+    shield_candidates = [p for p in platforms_with_motion if id(p) in coin_clear]
     rng.shuffle(shield_candidates)
+    orb_rects = [orb.rect for orb in double_jump_orbs]
     for platform in shield_candidates:
         shield_rect = pygame.Rect(platform.rect.centerx - 20, platform.rect.top - 62, 40, 40)
         aura = shield_rect.inflate(12, 12)
         aura.bottom = platform.rect.top - 6
         if not area_is_clear(aura, platform.rect):
             continue
-        if any(shield_rect.colliderect(orb.rect) for orb in double_jump_orbs):
+        if shield_rect.collidelist(orb_rects) != -1:
             continue
         if has_low_headroom(platform, min_gap=120):
             continue
@@ -1999,7 +2594,7 @@ def generate_level(stage: int, rng: random.Random, theme_index: int) -> dict:
         break
 
     sword_tokens: List[SwordPowerUp] = []
-    sword_candidates = [p for p in platforms_with_motion if has_coin_clearance(p.rect) and is_surface_reachable(p)]
+    sword_candidates = [p for p in platforms_with_motion if id(p) in coin_clear and id(p) in reachable]
     rng.shuffle(sword_candidates)
     for platform in sword_candidates:
         sword_rect = pygame.Rect(platform.rect.centerx - 16, platform.rect.top - 56, 32, 32)
@@ -2170,7 +2765,7 @@ def generate_boss_level(stage: int, rng: random.Random, theme_index: int) -> dic
                 36,
                 40,
             )
-            enemies.append(Enemy(enemy_rect, (patrol_left, patrol_right), speed=2.8 + rng.random() * 1.3))
+            enemies.append(Enemy(enemy_rect, (patrol_left, patrol_right), speed=int(2.8 + rng.random() * 1.3)))
 
     shooters: List[ShooterEnemy] = []
     if rng.random() < 0.75:
@@ -2269,16 +2864,13 @@ def generate_secret_3d_level(seed: int | None = None) -> dict:
     moving_platforms: List[MovingPlatform] = []
 
     coins: List[Coin] = []
+    placement_area = floor_rect.inflate(-80, -80)
+    obstacle_zones = [obstacle.inflate(40, 40) for obstacle in obstacles]
+    coin_zones: List[pygame.Rect] = []
     def fits(rect: pygame.Rect) -> bool:
-        if not floor_rect.inflate(-80, -80).contains(rect):
+        if not placement_area.contains(rect):
             return False
-        for obstacle in obstacles:
-            if rect.colliderect(obstacle.inflate(40, 40)):
-                return False
-        for existing in coins:
-            if rect.colliderect(existing.rect.inflate(24, 24)):
-                return False
-        return True
+        return rect.collidelist(obstacle_zones) == -1 and rect.collidelist(coin_zones) == -1
 
     attempts = 0
     desired_coins = 14
@@ -2293,6 +2885,7 @@ def generate_secret_3d_level(seed: int | None = None) -> dict:
         coin_rect.y -= coin_rect.height // 2
         if fits(coin_rect):
             coins.append(Coin(coin_rect))
+            coin_zones.append(coin_rect.inflate(24, 24))
 
     pickup_padding = 72
     def place_pickup(size: Tuple[int, int]) -> pygame.Rect:
@@ -2382,19 +2975,27 @@ class Camera:
         self.x = 0.0
 
     def update(self, target_x: float, level_length: float) -> None:
-        max_offset = max(0.0, level_length - SCREEN_WIDTH)
-        desired = clamp(target_x - SCREEN_WIDTH / 2, 0, max_offset)
-        self.x = lerp(self.x, desired, CAMERA_LERP)
+        max_offset = level_length - SCREEN_WIDTH
+        if max_offset < 0.0:
+            max_offset = 0.0
+        desired = target_x - SCREEN_WIDTH / 2
+        if desired > max_offset:
+            desired = max_offset
+        if desired < 0:
+            desired = 0
+        self.x += (desired - self.x) * CAMERA_LERP
 
 
 class ParallaxSky:
     def __init__(self, width: int, height: int) -> None:
         self.width = width
         self.height = height
+        # (x, pixel y, pixel radius, twinkle rate); only x feeds fractional maths.
         self.stars = [
             (
-                pygame.Vector2(random.uniform(0, width), random.uniform(0, height * 0.7)),
-                random.uniform(1, 3),
+                random.uniform(0, width),
+                int(random.uniform(0, height * 0.7)),
+                int(random.uniform(1, 3)),
                 random.uniform(0.5, 1.0),
             )
             for _ in range(120)
@@ -2402,20 +3003,23 @@ class ParallaxSky:
         self.timer = 0.0
         self.theme_gradients: List[pygame.Surface] = []
         self.theme_star_colours: List[pygame.Color] = []
-        self.theme_moons: List[pygame.Color] = []
+        self.theme_moons: List[pygame.Surface] = []
         for theme in BACKGROUND_THEMES:
-            gradient = pygame.Surface((width, height)).convert()
+            column = pygame.Surface((1, height)).convert()
+            top, bottom = theme["top"], theme["bottom"]
+            red, green, blue = top.r, top.g, top.b
+            d_red, d_green, d_blue = bottom.r - red, bottom.g - green, bottom.b - blue
             for y in range(height):
                 blend = y / height
-                colour = pygame.Color(
-                    int(lerp(theme["top"].r, theme["bottom"].r, blend)),
-                    int(lerp(theme["top"].g, theme["bottom"].g, blend)),
-                    int(lerp(theme["top"].b, theme["bottom"].b, blend)),
-                )
-                pygame.draw.line(gradient, colour, (0, y), (width, y))
-            self.theme_gradients.append(gradient)
+                column.set_at((0, y), (int(red + d_red * blend), int(green + d_green * blend), int(blue + d_blue * blend)))
+            self.theme_gradients.append(pygame.transform.scale(column, (width, height)))
             self.theme_star_colours.append(theme["stars"])
-            self.theme_moons.append(theme["moon"])
+            moon = pygame.Surface((MOON_RADIUS * 2 + 2, MOON_RADIUS * 2 + 2))
+            moon.fill((0, 0, 0))
+            pygame.draw.circle(moon, theme["moon"], (MOON_RADIUS + 1, MOON_RADIUS + 1), MOON_RADIUS)
+            pygame.draw.circle(moon, MOON_SHINE, (MOON_RADIUS + 1 - 12, MOON_RADIUS + 1 - 10), 9)
+            moon.set_colorkey((0, 0, 0))
+            self.theme_moons.append(moon)
         self.theme_index = 0
 
     def update(self, dt: float) -> None:
@@ -2431,20 +3035,21 @@ class ParallaxSky:
         surface.blit(gradient, (0, 0))
 
         moon_x = int((camera_x * 0.2) % (self.width + 200) - 100)
-        pygame.draw.circle(surface, self.theme_moons[self.theme_index], (moon_x, 120), 38)
-        pygame.draw.circle(surface, pygame.Color(255, 255, 255, 220), (moon_x - 12, 110), 9)
+        surface.blit(self.theme_moons[self.theme_index], (moon_x - MOON_RADIUS - 1, 120 - MOON_RADIUS - 1))
 
         star_colour = self.theme_star_colours[self.theme_index]
-        for pos, radius, twinkle in self.stars:
-            twinkle_factor = (math.sin(self.timer * twinkle + pos.x) + 1) * 0.5
-            intensity = 0.35 + 0.65 * twinkle_factor
-            colour = pygame.Color(
-                int(clamp(star_colour.r * intensity, 0, 255)),
-                int(clamp(star_colour.g * intensity, 0, 255)),
-                int(clamp(star_colour.b * intensity, 0, 255)),
-            )
-            offset_x = (pos.x - camera_x * 0.3) % self.width
-            pygame.draw.circle(surface, colour, (int(offset_x), int(pos.y)), int(radius))
+        red, green, blue = star_colour.r, star_colour.g, star_colour.b
+        sin = math.sin
+        timer = self.timer
+        scroll = camera_x * 0.3
+        width = self.width
+        dots = []
+        for star_x, star_y, radius, twinkle in self.stars:
+            intensity = 0.35 + 0.65 * ((sin(timer * twinkle + star_x) + 1) * 0.5)
+            colour = (int(red * intensity), int(green * intensity), int(blue * intensity))
+            dots.append((particle_dot(colour, radius),
+                         (int((star_x - scroll) % width) - radius - 1, star_y - radius - 1)))
+        surface.blits(dots, doreturn=False)
 
 
 # ---------------------------------------------------------------------------
@@ -2459,6 +3064,8 @@ class GameState:
     VICTORY = "victory"
     SECRET_PROMPT = "secret_prompt"
 
+    IDLE = frozenset((MENU, PAUSED, GAME_OVER, VICTORY))
+
 
 class LevelManager:
     def __init__(self, stage_count: int = 3) -> None:
@@ -2467,13 +3074,25 @@ class LevelManager:
         self.level_blueprints: List[dict] = []
         self.platforms: List[Platform] = []
         self.moving_platforms: List[MovingPlatform] = []
+        self.all_platforms: List[Platform] = []
+        self.platform_rects: List[pygame.Rect] = []
+        self._platform_order: List[int] = []
+        self._platform_lefts: List[int] = []
+        self._platform_reach: int = 0
         self.enemies: List[Enemy] = []
         self.shooters: List[ShooterEnemy] = []
         self.double_jump_orbs: List[DoubleJumpPowerUp] = []
         self.sword_tokens: List[SwordPowerUp] = []
         self.shield_tokens: List[ShieldPowerUp] = []
+        # Pickup rects padded by PICKUP_REACH, index-aligned with their token lists.
+        self.orb_zones: List[pygame.Rect] = []
+        self.sword_zones: List[pygame.Rect] = []
+        self.shield_zones: List[pygame.Rect] = []
         self.coins: List[Coin] = []
+        self.coin_rects: List[pygame.Rect] = []
+        self.coins_remaining: int = 0
         self.goal = GoalFlag(pygame.Rect(0, 0, 32, 80))
+        self.goal_zone = self.goal.rect.inflate(40, 40)
         self.spawn_point: Tuple[int, int] = (80, 420)
         self.kill_plane = SCREEN_HEIGHT + 200
         self.level_length = SCREEN_WIDTH
@@ -2506,8 +3125,15 @@ class LevelManager:
 
     def reset_level(self) -> None:
         data = self.level_blueprints[self.level_index]
-        self.platforms = [clone_platform(p) for p in data["platforms"]]
+        # Static platforms carry no per-run state, so the blueprint instances are shared.
+        self.platforms = list(data["platforms"])
         self.moving_platforms = [clone_platform(mp) for mp in data["moving_platforms"]]
+        # Platform rects are only ever moved in place, so these lists stay valid for the whole level.
+        self.all_platforms = self.platforms + self.moving_platforms
+        self.platform_rects = [platform.rect for platform in self.all_platforms]
+        self._platform_order = sorted(range(len(self.platforms)), key=lambda i: self.platforms[i].rect.left)
+        self._platform_lefts = [self.platforms[i].rect.left for i in self._platform_order]
+        self._platform_reach = max((platform.rect.width for platform in self.platforms), default=0)
         self.enemies = [
             Enemy(
                 e.rect.copy(),
@@ -2538,9 +3164,12 @@ class LevelManager:
             coin = Coin(c.rect.copy())
             coin.pulse = c.pulse
             self.coins.append(coin)
+        self.coin_rects = [coin.rect for coin in self.coins]
+        self.coins_remaining = len(self.coins)
         goal = data["goal"]
         goal_style = data.get("goal_style", getattr(goal, "style", "flag"))
         self.goal = GoalFlag(goal.rect.copy(), flutter=getattr(goal, "flutter", 0.0), style=goal_style)
+        self.goal_zone = self.goal.rect.inflate(40, 40)
         self.spawn_point = data["spawn_point"]
         self.kill_plane = data["kill_plane"]
         self.level_length = data["length"]
@@ -2578,6 +3207,9 @@ class LevelManager:
                 clone = SwordPowerUp(sword.rect.copy())
                 clone.pulse = sword.pulse
                 self.sword_tokens.append(clone)
+        self.orb_zones = [orb.rect.inflate(PICKUP_REACH, PICKUP_REACH) for orb in self.double_jump_orbs]
+        self.sword_zones = [sword.rect.inflate(PICKUP_REACH, PICKUP_REACH) for sword in self.sword_tokens]
+        self.shield_zones = [shield.rect.inflate(PICKUP_REACH, PICKUP_REACH) for shield in self.shield_tokens]
         boss_template = data.get("boss")
         self.boss = boss_template.clone() if boss_template else None
         self.boss_victory_timer = 0.0
@@ -2590,64 +3222,71 @@ class LevelManager:
         sword = SwordPowerUp(slot.copy())
         sword.pulse = random.random() * math.tau
         self.sword_tokens.append(sword)
+        self.sword_zones.append(sword.rect.inflate(PICKUP_REACH, PICKUP_REACH))
         self.sword_spawn_index = (self.sword_spawn_index + 1) % max(1, len(self.sword_spawn_points))
         self.sword_spawn_timer = 3.0 if not initial else 2.0
 
-    @property
-    def all_platforms(self) -> List[Platform]:
-        return self.platforms + self.moving_platforms
+    def platforms_in_view(self, left: float, right: float) -> List[Platform]:
+        # Indexed by left edge; draw order is preserved.
+        lefts = self._platform_lefts
+        first = bisect_left(lefts, left - self._platform_reach)
+        last = bisect_right(lefts, right)
+        platforms = self.platforms
+        visible = [platforms[i] for i in sorted(self._platform_order[first:last]) if platforms[i].rect.right >= left]
+        visible.extend(mp for mp in self.moving_platforms if mp.rect.right >= left and mp.rect.left <= right)
+        return visible
 
     @property
     def powerups(self) -> List[DoubleJumpPowerUp | SwordPowerUp | ShieldPowerUp]:
         return [*self.double_jump_orbs, *self.sword_tokens, *self.shield_tokens]
 
-    def update(self, dt: float, player_rect: pygame.Rect) -> List[Projectile]:
+    def update(self, dt: float, player_rect: pygame.Rect, camera_x: float = 0.0) -> List[Projectile]:
         spawned: List[Projectile] = []
-        static_rects = [platform.rect for platform in self.platforms]
-        moving_rects = [mp.rect for mp in self.moving_platforms]
-        for index, platform in enumerate(self.moving_platforms):
-            obstacles = static_rects + [moving_rects[i] for i in range(len(self.moving_platforms)) if i != index]
+        view_left = camera_x - CULL_MARGIN
+        view_right = camera_x + SCREEN_WIDTH + CULL_MARGIN
+        # Moving platforms skip their own rect by identity, so the level-wide
+        # rect list doubles as every platform's obstacle list.
+        obstacles = self.platform_rects
+        for platform in self.moving_platforms:
             platform.update(dt, obstacles)
-            moving_rects[index] = platform.rect
         self.enemies = [enemy for enemy in self.enemies if enemy.update(dt)]
         updated_shooters: List[ShooterEnemy] = []
         for shooter in self.shooters:
-            alive, new_projectiles = shooter.update(dt, player_rect.centerx)
+            on_screen = view_left <= shooter.rect.centerx <= view_right
+            alive, new_projectiles = shooter.update(dt, player_rect.centerx, on_screen)
             spawned.extend(new_projectiles)
             if alive:
                 updated_shooters.append(shooter)
         self.shooters = updated_shooters
-        for orb in self.double_jump_orbs:
-            orb.update(dt)
-        for sword in list(self.sword_tokens):
-            sword.update(dt)
+        advance_pulses(self.double_jump_orbs, dt * DoubleJumpPowerUp.PULSE_RATE)
+        advance_pulses(self.sword_tokens, dt * SwordPowerUp.PULSE_RATE)
         if self._is_boss_level:
-            collected_any = False
-            for sword in list(self.sword_tokens):
-                if sword.collected:
-                    self.sword_tokens.remove(sword)
-                    collected_any = True
-            if collected_any:
+            remaining = [sword for sword in self.sword_tokens if not sword.collected]
+            if len(remaining) != len(self.sword_tokens):
+                self.sword_tokens = remaining
+                self.sword_zones = [sword.rect.inflate(PICKUP_REACH, PICKUP_REACH) for sword in remaining]
                 self.sword_spawn_timer = max(self.sword_spawn_timer, 2.2)
             if not self.sword_tokens and self.sword_spawn_points:
                 if self.sword_spawn_timer > 0:
-                    self.sword_spawn_timer = max(0.0, self.sword_spawn_timer - dt)
+                    self.sword_spawn_timer = self.sword_spawn_timer - dt if self.sword_spawn_timer > dt else 0.0
                 else:
                     self._spawn_boss_sword()
-        for shield in self.shield_tokens:
-            if not shield.collected:
-                shield.update(dt)
+        advance_pulses(self.shield_tokens, dt * ShieldPowerUp.PULSE_RATE)
         if self.boss:
             _, boss_projectiles = self.boss.update(dt, player_rect)
             spawned.extend(boss_projectiles)
         if self.goal:
             self.goal.update(dt)
         if self.boss and self.boss.defeated and self._boss_transition_pending and self.boss_victory_timer > 0:
-            self.boss_victory_timer = max(0.0, self.boss_victory_timer - dt)
+            self.boss_victory_timer = self.boss_victory_timer - dt if self.boss_victory_timer > dt else 0.0
         return spawned
 
     def remaining_coins(self) -> int:
-        return sum(not coin.collected for coin in self.coins)
+        return self.coins_remaining
+
+    def collect_coin(self, coin: Coin) -> None:
+        coin.collected = True
+        self.coins_remaining -= 1
 
     def advance(self) -> bool:
         if self.level_index + 1 < self.total_levels:
@@ -2691,6 +3330,10 @@ class MarioLikeGame:
         self.screen = pygame.display.set_mode(default_pair)
         pygame.display.set_caption("Neon Night Run")
         self.clock = pygame.time.Clock()
+        self.enemy_grid = SpatialGrid()
+        self.shooter_grid = SpatialGrid()
+        self.projectile_grid = SpatialGrid()
+        self.draw_batch = DrawBatch()
         self.state = GameState.MENU
         self.hard_mode = False
         self.max_lives = 3
@@ -2713,16 +3356,16 @@ class MarioLikeGame:
         spawn_x, spawn_y = self.levels.spawn_point
         self.player = Player(pygame.Rect(spawn_x, spawn_y, 44, 60))
         self.particles: List[Particle] = []
-        self.projectiles: List[Projectile] = []
+        self.projectiles = ProjectilePool()
         self.slashes: List[SwordBeam] = []
         self.jump_spheres: List[JumpSphereEffect] = []
         self.score = 0
         self.combo_timer = 0.0
         self.time_elapsed = 0.0
         self.lives = self.max_lives
-        self.jump_was_pressed = False
-        self.attack_was_pressed = False
-        self.nova_was_pressed = False
+        self.jump_queued = False
+        self.attack_queued = False
+        self.nova_queued = False
         self.combo_nova_ready = False
         self.combo_nova_cooldown = 0.0
         self.camera.x = 0
@@ -2826,9 +3469,9 @@ class MarioLikeGame:
         self.secret_portal_pos = pygame.Vector2(anchor)
         self.player.vel.xy = (0, 0)
         self.player.on_ground = True
-        self.jump_was_pressed = False
-        self.attack_was_pressed = False
-        self.nova_was_pressed = False
+        self.jump_queued = False
+        self.attack_queued = False
+        self.nova_queued = False
         self.particles.extend(self._sparkle_effect(anchor))
         self.projectiles.clear()
         self.slashes.clear()
@@ -2918,9 +3561,9 @@ class MarioLikeGame:
         self.player.vel.xy = (0, 0)
         self.player.on_ground = False
         self.player.invincible_timer = 0.0
-        self.jump_was_pressed = False
-        self.attack_was_pressed = False
-        self.nova_was_pressed = False
+        self.jump_queued = False
+        self.attack_queued = False
+        self.nova_queued = False
 
     def _restart_level_after_life_loss(self) -> None:
         self.player.invincible_timer = 1.2
@@ -2949,73 +3592,59 @@ class MarioLikeGame:
 
     # ------------------------------ Update ------------------------------
     def update(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
         if self.state == GameState.PLAYING:
+            keys = pygame.key.get_pressed()
+            left_held = keys[pygame.K_LEFT] or keys[pygame.K_a]
+            right_held = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+            up_held = keys[pygame.K_UP] or keys[pygame.K_w]
+            down_held = keys[pygame.K_DOWN] or keys[pygame.K_s]
+            jump_pressed, attack_pressed, nova_pressed = self.jump_queued, self.attack_queued, self.nova_queued
+            self.jump_queued = self.attack_queued = self.nova_queued = False
+            player = self.player
+            secret_3d = self.levels.secret_3d
+
             self.time_elapsed += dt
             if self.combo_nova_cooldown > 0:
-                self.combo_nova_cooldown = max(0.0, self.combo_nova_cooldown - dt)
-            nova_pressed = keys[pygame.K_e]
-            if (
-                nova_pressed
-                and not self.nova_was_pressed
-                and self.combo_nova_ready
-                and self.combo_nova_cooldown <= 0
-            ):
+                self.combo_nova_cooldown = self.combo_nova_cooldown - dt if self.combo_nova_cooldown > dt else 0.0
+            if nova_pressed and self.combo_nova_ready and self.combo_nova_cooldown <= 0:
                 self._trigger_combo_nova()
-            self.nova_was_pressed = nova_pressed
-            direction = 0
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                direction -= 1
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                direction += 1
-            depth_direction = 0.0
-            if self.levels.secret_3d:
-                if keys[pygame.K_UP] or keys[pygame.K_w]:
-                    depth_direction -= 1
-                if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                    depth_direction += 1
-            self.player.move(direction, dt, depth_direction)
-
-            if self.levels.secret_3d:
-                jump_pressed = False
-            else:
-                jump_pressed = keys[pygame.K_UP] or keys[pygame.K_SPACE] or keys[pygame.K_w]
-                if jump_pressed and not self.jump_was_pressed and self.player.jump():
-                    self.particles.extend(self.player.emit_jump_particles())
-                    self.particles.extend(self.player.emit_wind_gust())
-                    if self.player.consume_double_jump_effect():
-                        centre = pygame.Vector2(self.player.rect.centerx, self.player.rect.bottom + 12)
-                        self.jump_spheres.append(
-                            JumpSphereEffect(
-                                centre=centre,
-                                width=self.player.rect.width + 36,
-                                height=28,
-                            )
+            direction = bool(right_held) - bool(left_held)
+            depth_direction = float(bool(down_held) - bool(up_held)) if secret_3d else 0.0
+            player.move(direction, dt, depth_direction)
+
+            if jump_pressed and not secret_3d and player.jump():
+                self.particles.extend(player.emit_jump_particles())
+                self.particles.extend(player.emit_wind_gust())
+                if player.consume_double_jump_effect():
+                    centre = pygame.Vector2(player.rect.centerx, player.rect.bottom + 12)
+                    self.jump_spheres.append(
+                        JumpSphereEffect(
+                            centre=centre,
+                            width=player.rect.width + 36,
+                            height=28,
                         )
-            self.jump_was_pressed = jump_pressed
+                    )
 
-            attack_pressed = keys[pygame.K_LSHIFT]
             if (
                 attack_pressed
-                and not self.attack_was_pressed
-                and self.player.sword_ready
-                and self.player.sword_cooldown <= 0
-                and self.player.sword_charges > 0
+                and player.sword_ready
+                and player.sword_cooldown <= 0
+                and player.sword_charges > 0
             ):
-                slash = self.player.perform_sword_attack()
+                slash = player.perform_sword_attack()
                 self.slashes.append(slash)
                 self.particles.extend(self._sparkle_effect(slash.rect.center))
+                self._rebuild_collision_grids()
                 self._apply_slash_damage(slash)
-            self.attack_was_pressed = attack_pressed
 
-            new_particles = self.player.update(self.levels.all_platforms, dt)
+            new_particles = player.update(self.levels.all_platforms, dt, self.levels.platform_rects)
             self.particles.extend(new_particles)
 
-            if self.player.rect.top > self.levels.kill_plane:
+            if player.rect.top > self.levels.kill_plane:
                 self.lose_life("fall")
                 return
 
-            spawned_projectiles = self.levels.update(dt, self.player.rect)
+            spawned_projectiles = self.levels.update(dt, self.player.rect, self.camera.x)
             if spawned_projectiles:
                 self.projectiles.extend(spawned_projectiles)
 
@@ -3036,6 +3665,7 @@ class MarioLikeGame:
                 return
 
             self.update_projectiles(dt)
+            self._rebuild_collision_grids()
             self.update_slashes(dt)
             self.handle_collisions(dt)
             if self.state != GameState.PLAYING:
@@ -3061,61 +3691,77 @@ class MarioLikeGame:
             if self.projectiles:
                 self.update_projectiles(dt)
             if self.slashes:
+                self._rebuild_collision_grids()
                 self.update_slashes(dt)
             if self.levels.goal:
                 self.levels.goal.update(dt)
         else:
             self.sky.update(dt)
-            self.update_particles(dt)
-            self.update_jump_spheres(dt)
+            if self.particles:
+                self.update_particles(dt)
+            if self.jump_spheres:
+                self.update_jump_spheres(dt)
             if self.projectiles:
                 self.update_projectiles(dt)
             if self.slashes:
+                self._rebuild_collision_grids()
                 self.update_slashes(dt)
-            self.nova_was_pressed = False
+            self.jump_queued = self.attack_queued = self.nova_queued = False
 
     def update_projectiles(self, dt: float) -> None:
-        level_rects = [platform.rect for platform in self.levels.all_platforms]
-        for projectile in list(self.projectiles):
-            if not projectile.update(dt):
-                self.projectiles.remove(projectile)
-                continue
-            rect = projectile.rect
-            if rect.right < -160 or rect.left > self.levels.level_length + 220 or rect.top > SCREEN_HEIGHT + 220 or rect.bottom < -220:
-                self.projectiles.remove(projectile)
-                continue
-            if any(rect.colliderect(platform_rect) for platform_rect in level_rects):
-                self.projectiles.remove(projectile)
-                self.particles.extend(self._sparkle_effect(rect.center))
+        bounds = pygame.Rect(-160, -220, self.levels.level_length + 380, SCREEN_HEIGHT + 440)
+        for impact in self.projectiles.update(dt, bounds, self.levels.platform_rects):
+            self.particles.extend(self._sparkle_effect(impact))
 
     def update_slashes(self, dt: float) -> None:
-        for slash in list(self.slashes):
-            if not slash.update(dt):
-                self.slashes.remove(slash)
-                continue
-            self._apply_slash_damage(slash)
+        active: List[SwordBeam] = []
+        for slash in self.slashes:
+            if slash.update(dt):
+                active.append(slash)
+                self._apply_slash_damage(slash)
+        self.slashes = active
 
     def update_particles(self, dt: float) -> None:
-        for particle in list(self.particles):
-            particle.update(dt)
-            if particle.life <= 0:
-                self.particles.remove(particle)
+        view_left = self.camera.x - CULL_MARGIN
+        view_right = self.camera.x + SCREEN_WIDTH + CULL_MARGIN
+        alive: List[Particle] = []
+        expired: List[Particle] = []
+        keep, drop = alive.append, expired.append
+        shrink = 18 * dt
+        for particle in self.particles:
+            particle.life -= dt
+            if view_left <= particle.x <= view_right:
+                vx = particle.vx
+                vy = particle.vy
+                particle.x += vx * dt
+                particle.y += vy * dt
+                particle.vx = vx * 0.92
+                particle.vy = vy * 0.92
+                radius = particle.radius - shrink
+                particle.radius = radius if radius > 0.0 else 0.0
+            # Below one pixel the dot draws nothing.
+            if particle.life <= 0 or particle.radius < 1.0:
+                drop(particle)
+            else:
+                keep(particle)
+        self.particles = alive
+        if expired:
+            release_particles(expired)
 
     def update_jump_spheres(self, dt: float) -> None:
-        for sphere in list(self.jump_spheres):
-            if not sphere.update(dt):
-                self.jump_spheres.remove(sphere)
+        self.jump_spheres = [sphere for sphere in self.jump_spheres if sphere.update(dt)]
 
     def update_combo_timer(self, dt: float) -> None:
         if self.combo_timer > 0:
-            self.combo_timer = max(0.0, self.combo_timer - dt)
+            self.combo_timer = self.combo_timer - dt if self.combo_timer > dt else 0.0
             if self.combo_timer == 0:
                 self.player.combo = 0
 
     def _apply_slash_damage(self, slash: SwordBeam) -> None:
         hitbox = slash.rect.inflate(24, 12)
+        reach = slash.rect.inflate(24 + SLASH_GRID_PAD * 2, 12 + SLASH_GRID_PAD * 2)
         scored = False
-        for enemy in self.levels.enemies:
+        for enemy in self.enemy_grid.region(reach):
             if enemy.stomped:
                 continue
             if not hitbox.colliderect(enemy.rect):
@@ -3130,7 +3776,7 @@ class MarioLikeGame:
                 scored = True
                 self.score += 40
             self.particles.extend(self._sparkle_effect(enemy.rect.center))
-        for shooter in self.levels.shooters:
+        for shooter in self.shooter_grid.region(reach):
             if shooter.stomped:
                 continue
             if hitbox.colliderect(shooter.rect):
@@ -3138,11 +3784,16 @@ class MarioLikeGame:
                 shooter.death_timer = ENEMY_DEATH_DURATION
                 scored = True
                 self.add_score(200, combo_bonus=True)
-        for projectile in list(self.projectiles):
+        deflected: List[Projectile] = []
+        for projectile in self.projectile_grid.region(reach):
             if hitbox.colliderect(projectile.rect):
-                self.projectiles.remove(projectile)
+                deflected.append(projectile)
                 self.particles.extend(self._sparkle_effect(projectile.rect.center))
                 scored = True
+        if deflected:
+            for projectile in deflected:
+                self.projectile_grid.discard(projectile.pos.x, projectile.pos.y, projectile)
+            self.projectiles.remove_all(deflected)
         boss = self.levels.boss
         if boss and not boss.defeated:
             boss_hitbox = boss.rect.inflate(-12, -12)
@@ -3157,10 +3808,24 @@ class MarioLikeGame:
             self.particles.extend(self._sparkle_effect(centre))
 
     # --------------------------- Collision logic ------------------------
+    def _rebuild_collision_grids(self) -> None:
+        self.enemy_grid.clear()
+        for enemy in self.levels.enemies:
+            if not enemy.stomped:
+                self.enemy_grid.add(enemy.rect.centerx, enemy.rect.centery, enemy)
+        self.shooter_grid.clear()
+        for shooter in self.levels.shooters:
+            if not shooter.stomped:
+                self.shooter_grid.add(shooter.rect.centerx, shooter.rect.centery, shooter)
+        self.projectile_grid.clear()
+        for projectile in self.projectiles:
+            self.projectile_grid.add(projectile.pos.x, projectile.pos.y, projectile)
+
     def handle_collisions(self, dt: float) -> None:
         player_rect = self.player.rect
+        player_x, player_y = player_rect.center
 
-        for enemy in self.levels.enemies:
+        for enemy in self.enemy_grid.nearby(player_x, player_y):
             if enemy.stomped:
                 continue
             if player_rect.colliderect(enemy.rect):
@@ -3184,7 +3849,7 @@ class MarioLikeGame:
                     self.lose_life("enemy")
                     return
 
-        for shooter in self.levels.shooters:
+        for shooter in self.shooter_grid.nearby(player_x, player_y):
             if shooter.stomped:
                 continue
             if player_rect.colliderect(shooter.rect):
@@ -3203,7 +3868,7 @@ class MarioLikeGame:
                     return
 
         player_hitbox = player_rect.inflate(-12, -6)
-        for projectile in list(self.projectiles):
+        for projectile in self.projectile_grid.nearby(*player_hitbox.center):
             if projectile.rect.colliderect(player_hitbox):
                 self.projectiles.remove(projectile)
                 if self.player.invincible_timer <= 0:
@@ -3221,35 +3886,35 @@ class MarioLikeGame:
                         self.lose_life("boss")
                 return
 
-        for coin in self.levels.coins:
-            coin.update(dt)
-            if not coin.collected and player_rect.colliderect(coin.rect):
-                coin.collected = True
+        advance_pulses(self.levels.coins, dt * Coin.PULSE_RATE)
+        coins = self.levels.coins
+        for index in player_rect.collidelistall(self.levels.coin_rects):
+            coin = coins[index]
+            if not coin.collected:
+                self.levels.collect_coin(coin)
                 self.add_score(100, combo_bonus=True)
                 self.particles.extend(self._sparkle_effect(coin.rect.center))
 
-        for orb in self.levels.double_jump_orbs:
-            if orb.collected:
-                continue
-            if player_hitbox.colliderect(orb.rect.inflate(6, 6)):
+        levels = self.levels
+        for index in player_hitbox.collidelistall(levels.orb_zones):
+            orb = levels.double_jump_orbs[index]
+            if not orb.collected:
                 orb.collected = True
                 self.player.grant_double_jump()
                 self.particles.extend(self._sparkle_effect(orb.rect.center))
                 self.add_score(50)
 
-        for sword in self.levels.sword_tokens:
-            if sword.collected:
-                continue
-            if player_hitbox.colliderect(sword.rect.inflate(6, 6)):
+        for index in player_hitbox.collidelistall(levels.sword_zones):
+            sword = levels.sword_tokens[index]
+            if not sword.collected:
                 sword.collected = True
                 self.player.grant_sword()
                 self.particles.extend(self._sparkle_effect(sword.rect.center))
                 self.add_score(75)
 
-        for shield in self.levels.shield_tokens:
-            if shield.collected:
-                continue
-            if player_hitbox.colliderect(shield.rect.inflate(6, 6)):
+        for index in player_hitbox.collidelistall(levels.shield_zones):
+            shield = levels.shield_tokens[index]
+            if not shield.collected:
                 shield.collected = True
                 self.player.add_shield()
                 self.particles.extend(self._shield_pickup_effect(shield.rect.center))
@@ -3258,7 +3923,7 @@ class MarioLikeGame:
         goal_ready = self.levels.remaining_coins() == 0
         if self.levels.is_boss_stage():
             goal_ready = goal_ready and (boss is None or boss.defeated)
-        if goal_ready and player_rect.colliderect(self.levels.goal.rect.inflate(40, 40)):
+        if goal_ready and player_rect.colliderect(self.levels.goal_zone):
             bonus = max(0, int(2500 - self.time_elapsed * 30))
             self.add_score(500 + bonus)
             last_regular_level = self.levels.level_index == self.levels.total_levels - 1
@@ -3312,43 +3977,15 @@ class MarioLikeGame:
         self.sky.set_theme(self.levels.theme_index)
         self.rift_timer = 0.0
         self.secret_portal_phase = 0.0
-        self.jump_was_pressed = False
-        self.attack_was_pressed = False
-        self.nova_was_pressed = False
+        self.jump_queued = False
+        self.attack_queued = False
+        self.nova_queued = False
 
     def _shield_pickup_effect(self, pos: Tuple[int, int]) -> List[Particle]:
-        particles: List[Particle] = []
-        for _ in range(14):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(140, 240)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-            particles.append(
-                Particle(
-                    pos=pygame.Vector2(pos),
-                    vel=vel,
-                    life=random.uniform(0.35, 0.6),
-                    colour=pygame.Color(140, 230, 255),
-                    radius=random.uniform(2.5, 4.5),
-                )
-            )
-        return particles
+        return emit_burst(pos[0], pos[1], 14, (140, 240), (0.35, 0.6), (2.5, 4.5), SHIELD_SPARK)
 
     def _shield_break_effect(self, pos: Tuple[int, int]) -> List[Particle]:
-        particles: List[Particle] = []
-        for _ in range(20):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(200, 320)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-            particles.append(
-                Particle(
-                    pos=pygame.Vector2(pos),
-                    vel=vel,
-                    life=random.uniform(0.25, 0.5),
-                    colour=pygame.Color(120, 200, 255),
-                    radius=random.uniform(2.0, 4.0),
-                )
-            )
-        return particles
+        return emit_burst(pos[0], pos[1], 20, (200, 320), (0.25, 0.5), (2.0, 4.0), SHIELD_SHARD)
 
     def _absorb_hit(self, reason: str, impact_pos: Tuple[int, int]) -> bool:
         if not self.player.consume_shield():
@@ -3360,7 +3997,7 @@ class MarioLikeGame:
     def _trigger_combo_nova(self) -> None:
         if not self.combo_nova_ready:
             return
-        centre = pygame.Vector2(self.player.rect.center)
+        centre_x, centre_y = self.player.rect.center
         radius = COMBO_NOVA_RADIUS
         self.combo_nova_ready = False
         self.combo_nova_cooldown = 8.0
@@ -3368,19 +4005,20 @@ class MarioLikeGame:
         self.combo_timer = 0.0
         self.jump_spheres.append(
             JumpSphereEffect(
-                centre=centre.copy(),
+                centre=pygame.Vector2(centre_x, centre_y),
                 width=radius * 1.6,
                 height=radius * 0.9,
                 timer=0.55,
                 lifetime=0.55,
             )
         )
+        reach_sq = radius * radius
         defeated = 0
         for enemy in self.levels.enemies:
             if enemy.stomped:
                 continue
-            distance = pygame.Vector2(enemy.rect.center).distance_to(centre)
-            if distance <= radius:
+            x, y = enemy.rect.center
+            if (x - centre_x) ** 2 + (y - centre_y) ** 2 <= reach_sq:
                 enemy.health = 0
                 enemy.stomped = True
                 enemy.death_timer = ENEMY_DEATH_DURATION
@@ -3389,46 +4027,35 @@ class MarioLikeGame:
         for shooter in self.levels.shooters:
             if shooter.stomped:
                 continue
-            distance = pygame.Vector2(shooter.rect.center).distance_to(centre)
-            if distance <= radius:
+            x, y = shooter.rect.center
+            if (x - centre_x) ** 2 + (y - centre_y) ** 2 <= reach_sq:
                 shooter.stomped = True
                 shooter.death_timer = ENEMY_DEATH_DURATION
                 defeated += 1
                 self.particles.extend(self._sparkle_effect(shooter.rect.center))
-        for projectile in list(self.projectiles):
-            distance = pygame.Vector2(projectile.rect.center).distance_to(centre)
-            if distance <= radius:
-                self.projectiles.remove(projectile)
-                self.particles.extend(self._sparkle_effect(projectile.rect.center))
+        vaporised: List[Projectile] = []
+        for projectile in self.projectiles:
+            point = projectile.rect.center
+            if (point[0] - centre_x) ** 2 + (point[1] - centre_y) ** 2 <= reach_sq:
+                vaporised.append(projectile)
+                self.particles.extend(self._sparkle_effect(point))
+        if vaporised:
+            self.projectiles.remove_all(vaporised)
         boss = self.levels.boss
         if boss and not boss.defeated:
-            boss_centre = pygame.Vector2(boss.rect.center)
+            x, y = boss.rect.center
             effective_radius = radius + max(boss.rect.width, boss.rect.height) * 0.35
-            if boss_centre.distance_to(centre) <= effective_radius:
+            if (x - centre_x) ** 2 + (y - centre_y) ** 2 <= effective_radius * effective_radius:
                 if boss.take_hit():
                     defeated += 1
                     self.levels.on_boss_hit()
                     self.particles.extend(self._sparkle_effect(boss.rect.center))
         if defeated > 0:
             self.add_score(200 * defeated)
-        self.particles.extend(self._sparkle_effect((int(centre.x), int(centre.y))))
+        self.particles.extend(self._sparkle_effect((centre_x, centre_y)))
 
     def _sparkle_effect(self, pos: Tuple[int, int]) -> List[Particle]:
-        particles = []
-        for _ in range(18):
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(160, 260)
-            vel = pygame.Vector2(math.cos(angle), math.sin(angle)) * speed
-            particles.append(
-                Particle(
-                    pos=pygame.Vector2(pos),
-                    vel=vel,
-                    life=random.uniform(0.3, 0.7),
-                    colour=GOLD,
-                    radius=random.uniform(2, 5),
-                )
-            )
-        return particles
+        return emit_burst(pos[0], pos[1], 18, (160, 260), (0.3, 0.7), (2, 5), GOLD)
 
     # ------------------------------- Draw -------------------------------
     def draw(self) -> None:
@@ -3454,21 +4081,29 @@ class MarioLikeGame:
         pygame.display.flip()
 
     def _draw_world(self) -> None:
+        view_left = self.camera.x - CULL_MARGIN
+        view_right = self.camera.x + SCREEN_WIDTH + CULL_MARGIN
         if self.levels.secret_3d:
             self._draw_rift_backdrop()
-        for platform in self.levels.all_platforms:
+        for platform in self.levels.platforms_in_view(view_left, view_right):
             platform.draw(self.screen, self.camera.x)
         for enemy in self.levels.enemies:
+            if enemy.rect.right < view_left or enemy.rect.left > view_right:
+                continue
             enemy.draw(self.screen, self.camera.x)
         for shooter in self.levels.shooters:
+            if shooter.rect.right < view_left or shooter.rect.left > view_right:
+                continue
             shooter.draw(self.screen, self.camera.x)
-        for coin in self.levels.coins:
+        for coin in pickups_in_view(self.levels.coins, view_left, view_right):
             coin.draw(self.screen, self.camera.x)
-        for powerup in self.levels.double_jump_orbs:
+        for powerup in pickups_in_view(self.levels.double_jump_orbs, view_left, view_right):
             powerup.draw(self.screen, self.camera.x)
-        for shield in self.levels.shield_tokens:
-            shield.draw(self.screen, self.camera.x)
-        for sword in self.levels.sword_tokens:
+        batch = self.draw_batch
+        for shield in pickups_in_view(self.levels.shield_tokens, view_left, view_right):
+            batch.extend(shield.sprites(self.camera.x))
+        batch.flush(self.screen)
+        for sword in pickups_in_view(self.levels.sword_tokens, view_left, view_right):
             sword.draw(self.screen, self.camera.x)
         if self.levels.boss:
             self.levels.boss.draw(self.screen, self.camera.x)
@@ -3478,31 +4113,45 @@ class MarioLikeGame:
             show_goal = show_goal and (boss is None or boss.defeated)
         if show_goal:
             self.levels.goal.draw(self.screen, self.camera.x)
-        for projectile in self.projectiles:
-            projectile.draw(self.screen, self.camera.x)
+        self.projectiles.draw(self.screen, self.camera.x)
         for sphere in self.jump_spheres:
-            sphere.draw(self.screen, self.camera.x)
+            batch.extend(sphere.sprites(self.camera.x))
+        batch.flush(self.screen)
         for slash in self.slashes:
-            slash.draw(self.screen, self.camera.x)
+            batch.extend(slash.sprites(self.camera.x))
+        batch.flush(self.screen)
         self.player.draw(self.screen, self.camera.x)
         if self.levels.secret_3d:
             self._draw_rift_foreground()
+        camera_x = self.camera.x
+        dots = []
         for particle in self.particles:
-            particle.draw(self.screen, self.camera.x)
+            x = particle.x
+            if view_left <= x <= view_right and particle.life > 0:
+                radius = int(particle.radius)
+                if radius > 0:
+                    dots.append((particle_dot(particle.colour, radius),
+                                 (int(x - camera_x) - radius - 1, int(particle.y) - radius - 1)))
+        batch.extend(dots)
+        batch.flush(self.screen)
 
     def _draw_rift_backdrop(self) -> None:
-        grid_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
         vanish_y = max(80, SCREEN_HEIGHT // 3)
-        vanish_x = SCREEN_WIDTH // 2
-        base_y = SCREEN_HEIGHT + 160
-        spoke_colour = pygame.Color(80, 220, 255, 70)
-        for i in range(-6, 7):
-            if i == 0:
-                offset_factor = 0.0
-            else:
-                offset_factor = i / 6
-            end_x = vanish_x + int(offset_factor * SCREEN_WIDTH * 0.75)
-            pygame.draw.aaline(grid_surface, spoke_colour, (vanish_x, vanish_y), (end_x, base_y))
+        spokes = _RIFT_SPOKES.get(size)
+        if spokes is None:
+            spokes = _RIFT_SPOKES[size] = pygame.Surface(size, pygame.SRCALPHA)
+            vanish_x = SCREEN_WIDTH // 2
+            base_y = SCREEN_HEIGHT + 160
+            for i in range(-6, 7):
+                if i == 0:
+                    offset_factor = 0.0
+                else:
+                    offset_factor = i / 6
+                end_x = vanish_x + int(offset_factor * SCREEN_WIDTH * 0.75)
+                pygame.draw.aaline(spokes, RIFT_SPOKE, (vanish_x, vanish_y), (end_x, base_y))
+        grid_surface = scratch_layer(size)
+        grid_surface.blit(spokes, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
 
         layer_count = 8
         scroll = (self.rift_timer * 0.6) % 1.0
@@ -3525,26 +4174,26 @@ class MarioLikeGame:
         self.screen.blit(grid_surface, (0, 0))
 
     def _draw_rift_foreground(self) -> None:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        overlay = scratch_layer((SCREEN_WIDTH, SCREEN_HEIGHT))
         glow_height = 180
         flux = (math.sin(self.rift_timer * 2.2) + 1) * 0.5
-        for i in range(glow_height):
-            blend = i / glow_height
-            alpha = int(70 * (1 - blend) * (0.6 + 0.4 * flux))
-            colour = (50, 230, 210, max(0, alpha))
-            pygame.draw.rect(
-                overlay,
-                colour,
-                (0, SCREEN_HEIGHT - i - 1, SCREEN_WIDTH, 1),
-            )
+        pulse = 0.6 + 0.4 * flux
+        column = bytearray()
+        for i in range(glow_height - 1, -1, -1):
+            column += bytes((50, 230, 210, max(0, int(70 * (1 - i / glow_height) * pulse))))
+        glow = pygame.image.frombuffer(column, (1, glow_height), "RGBA")
+        overlay.blit(
+            pygame.transform.scale(glow, (SCREEN_WIDTH, glow_height)),
+            (0, SCREEN_HEIGHT - glow_height),
+            special_flags=pygame.BLEND_RGBA_MAX,
+        )
         centre = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 48)
         radius = SCREEN_WIDTH // 3
-        beam_colour = pygame.Color(180, 255, 255, 80)
         for beam in range(5):
             angle = self.secret_portal_phase + beam * (math.tau / 5)
             end_x = centre[0] + int(math.cos(angle) * radius)
             end_y = centre[1] - int(math.sin(angle) * (radius * 0.6)) - 160
-            pygame.draw.aaline(overlay, beam_colour, centre, (end_x, end_y))
+            pygame.draw.aaline(overlay, RIFT_BEAM, centre, (end_x, end_y))
         self.screen.blit(overlay, (0, 0))
 
     def _draw_hud(self) -> None:
@@ -3552,12 +4201,8 @@ class MarioLikeGame:
         draw_text(self.screen, f"Level: {self.levels.level_index + 1}/{self.levels.total_levels}", (20, 60))
         theme_name = self.levels.secret_title or BACKGROUND_THEMES[self.levels.theme_index]["name"]
         heart_y = 110
-        for i in range(self.max_lives):
-            centre = (30 + i * 38, heart_y)
-            filled = i < self.lives
-            colour = CRIMSON if filled else pygame.Color(70, 70, 70)
-            outline = pygame.Color(255, 255, 255) if filled else pygame.Color(120, 120, 120)
-            draw_heart(self.screen, centre, 28, colour, outline)
+        if self.max_lives > 0:
+            self.screen.blit(heart_row(self.max_lives, self.lives), (30 - HUD_HEART_SIZE, heart_y - HUD_HEART_SIZE))
         draw_text(self.screen, f"Theme: {theme_name}", (20, heart_y + 36), colour=SMOKE)
         mode_label = "Hard Mode" if self.hard_mode else "Normal Mode"
         mode_colour = CRIMSON if self.hard_mode else CYAN
@@ -3698,32 +4343,24 @@ class MarioLikeGame:
         )
 
     def _draw_pause_overlay(self) -> None:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(screen_veil((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 120)), (0, 0))
         draw_text(self.screen, "Paused", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40), font=SUBTITLE_FONT, anchor="center")
         draw_text(self.screen, "Press ESC to resume", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10), anchor="center")
 
     def _draw_game_over(self) -> None:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(screen_veil((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 160)), (0, 0))
         draw_text(self.screen, "Game Over", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 80), font=TITLE_FONT, colour=CRIMSON, anchor="center")
         draw_text(self.screen, f"Final Score: {self.score}", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), font=SUBTITLE_FONT, anchor="center")
         draw_text(self.screen, "Press ENTER to try again", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60), anchor="center")
 
     def _draw_victory(self) -> None:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(screen_veil((SCREEN_WIDTH, SCREEN_HEIGHT), (0, 0, 0, 120)), (0, 0))
         draw_text(self.screen, "You Saved the Skyline!", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100), font=TITLE_FONT, colour=CYAN, anchor="center")
         draw_text(self.screen, f"Final Score: {self.score}", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), font=SUBTITLE_FONT, anchor="center")
         draw_text(self.screen, "Press ENTER to replay", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60), anchor="center")
 
     def _draw_secret_prompt_overlay(self) -> None:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((18, 10, 44, 160))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(screen_veil((SCREEN_WIDTH, SCREEN_HEIGHT), (18, 10, 44, 160)), (0, 0))
         headline_y = 140
         draw_text(
             self.screen,
@@ -3827,11 +4464,23 @@ class MarioLikeGame:
                         self.hard_mode = not self.hard_mode
                 elif event.key == pygame.K_r and self.state == GameState.PLAYING:
                     self.start_game()
+                elif self.state == GameState.PLAYING:
+                    # Edge-triggered actions are latched here and consumed by the next update.
+                    if event.key in JUMP_KEYS:
+                        # The jump keys act as one button: pressing a second one while
+                        # another is held does not jump again.
+                        keys = pygame.key.get_pressed()
+                        if not any(keys[key] for key in JUMP_KEYS if key != event.key):
+                            self.jump_queued = True
+                    elif event.key == pygame.K_LSHIFT:
+                        self.attack_queued = True
+                    elif event.key == pygame.K_e:
+                        self.nova_queued = True
 
     # ----------------------------- Game loop ----------------------------
     def run(self) -> None:
         while True:
-            dt = self.clock.tick(FPS) / 1000
+            dt = self.clock.tick(IDLE_FPS if self.state in GameState.IDLE else FPS) / 1000
             self.handle_events()
             self.update(dt)
             self.draw()